@@ -4,15 +4,24 @@ LinkedIn Scraper - Comprehensive LinkedIn scraping toolkit
 Combines profile scraping, job search, skill matching, and Excel export capabilities
 """
 
+import atexit
 import logging
+import sys
 import time
 import os
 import re
-from typing import List, Dict, Any, Optional
+import heapq
+import json
+import sqlite3
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, ClassVar, TYPE_CHECKING
 from datetime import datetime
-import pandas as pd
+import requests
 from dataclasses import dataclass, asdict
-from urllib.parse import urlencode, quote
+from urllib.parse import urlencode, quote, urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -20,14 +29,119 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve as sv
+
+from scraper_common import (
+    CHROME_CONTENT_PREFS, CHROME_PROFILE_DIR, DATACLASS_OPTIONS, FEED_URL, LOGIN_REDIRECT_MARKERS,
+    PROFILE_CACHE_PATH, PROFILE_CACHE_TTL, PROFILE_NAME_CSS, block_page_resources, skill_match
+)
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Recent successful job searches, keyed on the normalized request
+SEARCH_CACHE_TTL = 300
+SEARCH_CACHE_MAX_ENTRIES = 128
+_search_cache: Dict[tuple, tuple] = {}
+
+# Job search results persisted in the same cache file, keyed on the search URL and limit
+JOB_CACHE_TTL = 6 * 3600
+
+# Guest job listing endpoint; serves the same result cards as plain HTML, no browser needed
+JOBS_GUEST_API_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOBS_GUEST_PAGE_SIZE = 10
+JOBS_GUEST_MAX_WORKERS = 4
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+
+# LinkedIn job search filter codes
+EXPERIENCE_LEVEL_FILTERS = {
+    'internship': '1',
+    'entry_level': '2',
+    'associate': '3',
+    'mid_senior': '4',
+    'director': '5'
+}
+JOB_TYPE_FILTERS = {
+    'full_time': 'F',
+    'part_time': 'P',
+    'contract': 'C',
+    'temporary': 'T',
+    'volunteer': 'V'
+}
+
+# Profile page selectors, compiled once and matched against the parsed page
+PROFILE_SELECTORS = {
+    'name': sv.compile("h1.text-heading-xlarge"),
+    'headline': sv.compile("div.text-body-medium.break-words"),
+    'location': sv.compile("span.text-body-small.inline.t-black--light.break-words"),
+    'current_company': sv.compile("div[aria-label='Current company'] span"),
+    'about': sv.compile("section[aria-label='About'] div.display-flex.ph5.pv3"),
+    'connections': sv.compile("span.t-bold span"),
+    'experience': sv.compile("section[aria-label='Experience']"),
+    'education': sv.compile("section[aria-label='Education']")
+}
+SECTION_ITEM_SELECTOR = sv.compile("li.artdeco-list__item")
+ITEM_TITLE_SELECTOR = sv.compile("span[aria-hidden='true']")
+ITEM_SUBTITLE_SELECTOR = sv.compile("span.t-14.t-normal")
+# Every profile field lives under <main>; skip the nav, scripts and sidebar when building the tree
+PROFILE_PARSE_ONLY = SoupStrainer("main")
+# Job result card selectors, compiled once and matched against the parsed page
+JOB_CARD_SELECTOR = sv.compile("div.base-card")
+JOB_CARD_SELECTORS = {
+    'title': sv.compile("h3.base-search-card__title"),
+    'company': sv.compile("h4.base-search-card__subtitle"),
+    'location': sv.compile("span.job-search-card__location"),
+    'link': sv.compile("a.base-card__full-link")
+}
+
+# Selectors used against the live page through Selenium
+SKILLS_LINK_CSS = "a[href*='/details/skills/']"
+SKILL_ITEM_CSS = "span[aria-hidden='true']"
+JOB_RESULTS_LIST_CLASS = "jobs-search__results-list"
+
+# Reads every skill's text inside <main> in one WebDriver round trip
+SKILL_TEXTS_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]), "
+    "element => element.innerText.trim());"
+)
+
+# Job search pages only need the result cards; everything else is skipped at parse time.
+# The class attribute is still a raw string while parsing, so match the class as a token
+JOB_CARD_PARSE_ONLY = SoupStrainer("div", class_=re.compile(r"(?<!\S)base-card(?!\S)"))
+# Screen-reader duplicates that Selenium's .text never returned
+HIDDEN_TEXT_SELECTOR = sv.compile(".visually-hidden")
+
+# LinkedIn's internal REST API; returns profile JSON without rendering the page
+VOYAGER_API_URL = "https://www.linkedin.com/voyager/api"
+
+# Browser searches served by one driver before it is restarted to shed leaked memory
+DRIVER_MAX_SEARCHES = 50
+
+# Skills profiles are scored against unless the caller passes their own
+DEFAULT_TARGET_SKILLS = (
+    'Oracle', 'PL/SQL', 'SQL', 'Database', 'Oracle Database',
+    'Stored Procedures', 'Triggers', 'Functions', 'Packages',
+    'Performance Tuning', 'Query Optimization', 'Data Modeling',
+    'ETL', 'Data Warehouse', 'Oracle Forms', 'Oracle Reports',
+    'APEX', 'SQL*Plus', 'TOAD', 'SQL Developer', 'Unix',
+    'Shell Scripting', 'Python', 'Java', 'JavaScript'
+)
+
+# Excel export layout; sheet name and header style match what pandas' to_excel produced
+EXCEL_SHEET_NAME = "Sheet1"
+EXCEL_HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+EXCEL_MAX_COLUMN_WIDTH = 50
 
-@dataclass
+# One line per job in the interactive search results
+JOB_LINE_TEMPLATE = "- {job.title} at {job.company} ({job.location})"
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class ProfileData:
     """Store LinkedIn profile data"""
     name: str
@@ -45,6 +159,24 @@ class ProfileData:
     education: str = ""
     connections: str = ""
     
+    # Export column label -> attribute, in spreadsheet order
+    EXPORT_COLUMNS: ClassVar[tuple] = (
+        ('Name', 'name'),
+        ('Email', 'email'),
+        ('Headline', 'headline'),
+        ('Current Company', 'current_company'),
+        ('Location', 'location'),
+        ('Experience Summary', 'experience'),
+        ('Education', 'education'),
+        ('Skills Matched', 'required_skills_matched'),
+        ('Match Score (%)', 'skill_match_score'),
+        ('Total Skills', 'total_skills_count'),
+        ('All Skills', 'skills'),
+        ('About', 'about'),
+        ('Profile URL', 'profile_url'),
+        ('Connections', 'connections')
+    )
+    
     def to_dict(self):
         return {
             'Name': self.name,
@@ -64,7 +196,7 @@ class ProfileData:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class JobListing:
     """Store LinkedIn job listing data"""
     title: str
@@ -86,7 +218,7 @@ class JobListing:
             self.skills_matched = []
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class JobSearchRequest:
     """Job search request parameters"""
     skills: List[str]
@@ -103,7 +235,7 @@ class JobSearchRequest:
         self.skills = [skill.strip() for skill in self.skills if skill.strip()]
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class JobSearchResponse:
     """Job search response"""
     success: bool
@@ -113,7 +245,7 @@ class JobSearchResponse:
     message: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class ScrapingStatus:
     """Scraping operation status"""
     status: str
@@ -129,6 +261,44 @@ class ScrapingStatus:
             self.timestamp = datetime.now().isoformat()
 
 
+@lru_cache(maxsize=1024)
+def _job_search_params(skills: tuple, location: str, experience_level: str, job_type: str, company: str) -> dict:
+    """Build LinkedIn job search query parameters"""
+    params = {}
+    
+    # Keywords (skills)
+    if skills:
+        params['keywords'] = " OR ".join(skills)
+    
+    # Location
+    if location:
+        params['location'] = location
+    
+    # Experience level and job type filters
+    if experience_level in EXPERIENCE_LEVEL_FILTERS:
+        params['f_E'] = EXPERIENCE_LEVEL_FILTERS[experience_level]
+    if job_type in JOB_TYPE_FILTERS:
+        params['f_JT'] = JOB_TYPE_FILTERS[job_type]
+    
+    # Company
+    if company:
+        params['f_C'] = company
+    
+    # Time filter (recent jobs)
+    params['f_TPR'] = 'r86400'  # Last 24 hours
+    params['start'] = '0'
+    
+    return params
+
+
+@lru_cache(maxsize=128)
+def _job_search_url(base_url: str, skills: tuple, location: str, experience_level: str,
+                    job_type: str, company: str) -> str:
+    """Build a LinkedIn job search URL; repeated searches reuse the encoded string"""
+    params = _job_search_params(skills, location, experience_level, job_type, company)
+    return f"{base_url}?{urlencode(params, quote_via=quote)}"
+
+
 class LinkedInScraper:
     """Comprehensive LinkedIn scraper for both profiles and jobs"""
     
@@ -141,78 +311,145 @@ class LinkedInScraper:
         self.base_url = "https://www.linkedin.com/jobs/search"
         self.timeout = 10
         self.delay_between_requests = 2
+        self.cache_path = PROFILE_CACHE_PATH
+        self.chrome_profile_dir = CHROME_PROFILE_DIR
+        self._cache_conn = None
+        self._api_session = None
+        self._driver_searches = 0
+        self.logged_in = False
+        self._closes_at_exit = False
         
         # Default target skills (can be customized)
-        self.target_skills = [
-            'Oracle', 'PL/SQL', 'SQL', 'Database', 'Oracle Database',
-            'Stored Procedures', 'Triggers', 'Functions', 'Packages',
-            'Performance Tuning', 'Query Optimization', 'Data Modeling',
-            'ETL', 'Data Warehouse', 'Oracle Forms', 'Oracle Reports',
-            'APEX', 'SQL*Plus', 'TOAD', 'SQL Developer', 'Unix',
-            'Shell Scripting', 'Python', 'Java', 'JavaScript'
-        ]
-    
-    def setup_driver(self):
-        """Setup Safari driver with anti-detection measures"""
-        try:
-            # Use Safari WebDriver (built into macOS)
-            self.driver = webdriver.Safari()
-            
-            # Set window size
-            self.driver.set_window_size(1920, 1080)
-            
-            # Execute anti-detection script
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            
-            return self.driver
-        except Exception as e:
-            logger.error(f"Failed to create Safari driver: {e}")
-            # Fallback to Chrome if Safari fails
+        self.target_skills = list(DEFAULT_TARGET_SKILLS)
+    
+    def __enter__(self):
+        return self.start_session()
+    
+    def start_session(self):
+        """Start one browser session and log in once for a batch of scrapes"""
+        # Reuse a browser search_jobs kept warm; a second one would be orphaned and find the profile locked
+        self._drop_dead_driver()
+        if self.driver is None:
+            self.setup_driver()
+        if not self.logged_in:
+            self.logged_in = self.login_to_linkedin()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def _drop_dead_driver(self):
+        """Quit a kept-alive driver whose browser crashed or was closed, so the next use starts a new one"""
+        if self.driver is not None:
             try:
-                logger.info("Falling back to Chrome driver...")
-                options = Options()
+                self.driver.current_url
+            except WebDriverException:
+                logger.warning("Browser is no longer responding, starting a new one")
+                self._quit_driver()
+    
+    def _close_at_exit(self):
+        """Quit a long-lived browser when the interpreter exits; registered once per scraper"""
+        if not self._closes_at_exit:
+            atexit.register(self.close)
+            self._closes_at_exit = True
+    
+    def setup_driver(self, use_safari: bool = True):
+        """Setup Safari driver with anti-detection measures, falling back to Chrome"""
+        if use_safari:
+            try:
+                # Use Safari WebDriver (built into macOS)
+                self.driver = webdriver.Safari()
                 
-                if self.headless:
-                    options.add_argument("--headless")
-                    
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option('useAutomationExtension', False)
-                options.add_argument("--window-size=1920,1080")
-                options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
+                # Set window size
+                self.driver.set_window_size(1920, 1080)
+                self.driver.set_page_load_timeout(self.timeout)
                 
-                self.driver = webdriver.Chrome(options=options)
+                # Execute anti-detection script
                 self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+                
                 return self.driver
-            except Exception as chrome_error:
-                logger.error(f"Failed to create Chrome driver: {chrome_error}")
-                raise WebDriverException(f"Failed to initialize web driver: {e}")
+            except Exception as e:
+                logger.error(f"Failed to create Safari driver: {e}")
+                # Fallback to Chrome if Safari fails
+                logger.info("Falling back to Chrome driver...")
+        
+        return self._setup_chrome_driver()
+    
+    def _setup_chrome_driver(self):
+        """Setup Chrome driver with anti-detection measures"""
+        try:
+            options = Options()
+            
+            if self.headless:
+                options.add_argument("--headless")
+                
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-blink-features=AutomationControlled")
+            options.add_experimental_option("excludeSwitches", ["enable-automation"])
+            options.add_experimental_option('useAutomationExtension', False)
+            options.add_argument("--window-size=1920,1080")
+            options.add_argument(f"user-agent={USER_AGENT}")
+            options.add_argument(f"--user-data-dir={os.path.abspath(self.chrome_profile_dir)}")
+            options.add_argument("--profile-directory=Default")
+            options.add_experimental_option("prefs", CHROME_CONTENT_PREFS)
+            # Hand control back at DOMContentLoaded instead of waiting on trackers
+            options.page_load_strategy = 'eager'
+            
+            self.driver = webdriver.Chrome(options=options)
+            self.driver.set_page_load_timeout(self.timeout)
+            block_page_resources(self.driver)
+            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            return self.driver
+        except Exception as chrome_error:
+            logger.error(f"Failed to create Chrome driver: {chrome_error}")
+            raise WebDriverException(f"Failed to initialize web driver: {chrome_error}")
+    
+    def _navigate(self, url: str, driver=None):
+        """Load a page, stopping it once the page load timeout hits rather than failing"""
+        driver = driver or self.driver
+        try:
+            driver.get(url)
+        except TimeoutException:
+            logger.warning(f"Page load timed out, stopping it: {url}")
+            driver.execute_script("window.stop();")
+    
+    def is_logged_in(self) -> bool:
+        """Check whether the browser already has a valid LinkedIn session"""
+        try:
+            self._navigate(FEED_URL)
+            return "feed" in self.driver.current_url
+        except Exception:
+            return False
     
     def login_to_linkedin(self):
         """Login to LinkedIn"""
+        if self.is_logged_in():
+            logger.info("Reusing saved LinkedIn session")
+            return True
+            
         if not self.email or not self.password:
             logger.warning("LinkedIn credentials not provided. Some features may be limited.")
             return False
             
         try:
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
+            self._navigate("https://www.linkedin.com/login")
+            wait = WebDriverWait(self.driver, self.timeout)
             
             # Enter email
-            email_field = self.driver.find_element(By.ID, "username")
+            email_field = wait.until(EC.presence_of_element_located((By.ID, "username")))
             email_field.send_keys(self.email)
             
-            # Enter password
+            # Enter password and submit the form from the same field, saving the button lookup
             password_field = self.driver.find_element(By.ID, "password")
-            password_field.send_keys(self.password)
+            password_field.send_keys(self.password + Keys.RETURN)
             
-            # Click login button
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
-            login_button.click()
-            
-            time.sleep(5)
+            # Wait for LinkedIn to land on the feed, the network page or a checkpoint
+            try:
+                wait.until(lambda driver: any(marker in driver.current_url for marker in LOGIN_REDIRECT_MARKERS))
+            except TimeoutException:
+                pass
             
             # Check if login was successful
             if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
@@ -234,56 +471,149 @@ class LinkedInScraper:
         if not profile_skills:
             return 0.0, []
             
-        # Normalize skills for comparison
-        profile_skills_lower = [skill.lower().strip() for skill in profile_skills]
-        target_skills_lower = [skill.lower().strip() for skill in target_skills]
-        
-        # Find matching skills
-        matched_skills = []
-        for target_skill in target_skills_lower:
-            for profile_skill in profile_skills_lower:
-                if target_skill in profile_skill or profile_skill in target_skill:
-                    matched_skills.append(target_skill)
-                    break
+        # Identical skill lists recur across cached profiles and job cards; reuse earlier results
+        match_score, matched_skills = skill_match(tuple(profile_skills), tuple(target_skills))
+        return match_score, list(matched_skills)
+    
+    def _match_profile(self, skills: List[str], headline: str, about: str) -> tuple:
+        """Score a profile's skills together with its headline and About text"""
+        # Skills named only in the headline or summary still count towards the match
+        return self.calculate_skill_match((skills or []) + [text for text in (headline, about) if text])
+    
+    def _get_cache(self) -> sqlite3.Connection:
+        """Open the on-disk scrape cache, creating it on first use"""
+        if self._cache_conn is None:
+            # scrape_profiles_batch opens this in a worker thread and closes it from the caller's
+            self._cache_conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS profiles (url TEXT PRIMARY KEY, scraped_at REAL, data TEXT)"
+            )
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS job_searches (search_key TEXT PRIMARY KEY, scraped_at REAL, data TEXT)"
+            )
+        return self._cache_conn
+    
+    def _normalize_profile_url(self, profile_url: str) -> str:
+        """Reduce a profile URL to its host and path so variants share a cache entry"""
+        parsed = urlparse(profile_url.strip())
+        return f"{parsed.netloc.lower()}{parsed.path.rstrip('/').lower()}"
+    
+    def _get_cached_profile(self, profile_url: str) -> Optional[ProfileData]:
+        """Return a cached profile if it was scraped within PROFILE_CACHE_TTL"""
+        try:
+            row = self._get_cache().execute(
+                "SELECT scraped_at, data FROM profiles WHERE url = ?",
+                (self._normalize_profile_url(profile_url),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading profile cache: {e}")
+            return None
         
-        # Calculate match percentage
-        match_score = (len(matched_skills) / len(target_skills)) * 100 if target_skills else 0
+        if not row or time.time() - row[0] > PROFILE_CACHE_TTL:
+            return None
+        return ProfileData(**json.loads(row[1]))
+    
+    def _cache_profile(self, profile: ProfileData):
+        """Store a scraped profile in the on-disk cache"""
+        try:
+            with self._get_cache() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO profiles (url, scraped_at, data) VALUES (?, ?, ?)",
+                    (self._normalize_profile_url(profile.profile_url), time.time(), json.dumps(asdict(profile)))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing profile cache: {e}")
+    
+    def _job_cache_key(self, search_request: JobSearchRequest) -> str:
+        """Key persisted job searches on the search URL and the requested limit"""
+        return f"{self._build_search_url(search_request)}#{search_request.limit}"
+    
+    def _get_cached_jobs(self, search_request: JobSearchRequest) -> Optional[List[JobListing]]:
+        """Return cached job listings if the search ran within JOB_CACHE_TTL"""
+        try:
+            row = self._get_cache().execute(
+                "SELECT scraped_at, data FROM job_searches WHERE search_key = ?",
+                (self._job_cache_key(search_request),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Error reading job cache: {e}")
+            return None
         
-        return match_score, matched_skills
+        if not row or time.time() - row[0] > JOB_CACHE_TTL:
+            return None
+        return [JobListing(**job) for job in json.loads(row[1])]
+    
+    def _cache_jobs(self, search_request: JobSearchRequest, jobs: List[JobListing]):
+        """Store job search results in the on-disk cache"""
+        try:
+            with self._get_cache() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO job_searches (search_key, scraped_at, data) VALUES (?, ?, ?)",
+                    (self._job_cache_key(search_request), time.time(), json.dumps([asdict(job) for job in jobs]))
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Error writing job cache: {e}")
     
     def scrape_profile(self, profile_url: str) -> Optional[ProfileData]:
         """Scrape a single LinkedIn profile"""
+        cached = self._get_cached_profile(profile_url)
+        if cached:
+            logger.info(f"Using cached profile for {profile_url}")
+            # Re-score against the current target skills
+            cached.skill_match_score, cached.required_skills_matched = self._match_profile(cached.skills, cached.headline, cached.about)
+            return cached
+        
+        # Prefer the JSON API; fall back to rendering the page if it is unavailable
+        profile = self._fetch_profile_api(profile_url)
+        if profile:
+            self._cache_profile(profile)
+            return profile
+        
         try:
-            self.driver.get(profile_url)
-            time.sleep(self.wait_time)
+            self._navigate(profile_url)
+            try:
+                WebDriverWait(self.driver, self.timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, PROFILE_NAME_CSS))
+                )
+            except TimeoutException:
+                logger.warning(f"Timeout waiting for profile to render: {profile_url}")
+            
+            # Parse the page once and run every field selector against the local tree
+            page_source = self.driver.page_source
+            soup = BeautifulSoup(page_source, 'lxml', parse_only=PROFILE_PARSE_ONLY)
+            if not soup.contents:
+                # Unexpected layout without <main>; fall back to the whole page
+                soup = BeautifulSoup(page_source, 'lxml')
+            for hidden in HIDDEN_TEXT_SELECTOR.select(soup):
+                hidden.decompose()
             
             # Extract basic info
-            name = self._extract_text("h1.text-heading-xlarge")
-            headline = self._extract_text("div.text-body-medium.break-words")
-            location = self._extract_text("span.text-body-small.inline.t-black--light.break-words")
+            name = self._extract_text(soup, PROFILE_SELECTORS['name'])
+            headline = self._extract_text(soup, PROFILE_SELECTORS['headline'])
+            location = self._extract_text(soup, PROFILE_SELECTORS['location'])
             
             # Extract current company
-            current_company = self._extract_text("div[aria-label='Current company'] span")
+            current_company = self._extract_text(soup, PROFILE_SELECTORS['current_company'])
             
             # Extract about section
-            about = self._extract_text("section[aria-label='About'] div.display-flex.ph5.pv3")
+            about = self._extract_text(soup, PROFILE_SELECTORS['about'])
+            
+            # Extract connections
+            connections = self._extract_text(soup, PROFILE_SELECTORS['connections'])
             
             # Extract experience
-            experience = self._extract_experience()
+            experience = self._extract_experience(soup)
             
             # Extract education
-            education = self._extract_education()
+            education = self._extract_education(soup)
             
             # Extract skills
             skills = self._extract_skills()
             
             # Calculate skill match
-            match_score, matched_skills = self.calculate_skill_match(skills)
-            
-            # Extract connections
-            connections = self._extract_text("span.t-bold span")
+            match_score, matched_skills = self._match_profile(skills, headline, about)
             
-            return ProfileData(
+            profile = ProfileData(
                 name=name or "N/A",
                 headline=headline or "",
                 location=location or "",
@@ -299,94 +629,249 @@ class LinkedInScraper:
                 connections=connections or ""
             )
             
+            # Only cache pages that actually rendered a profile
+            if name:
+                self._cache_profile(profile)
+            
+            return profile
+            
         except Exception as e:
             logger.error(f"Error scraping profile {profile_url}: {e}")
             return None
     
-    def _extract_text(self, selector: str) -> str:
-        """Extract text from element using CSS selector"""
-        try:
-            element = self.driver.find_element(By.CSS_SELECTOR, selector)
-            return element.text.strip()
-        except NoSuchElementException:
-            return ""
+    def _get_api_session(self) -> Optional[requests.Session]:
+        """Build an HTTP session that reuses the browser's LinkedIn cookies"""
+        if self._api_session is None and self.driver:
+            cookies = {cookie['name']: cookie['value'] for cookie in self.driver.get_cookies()}
+            if 'li_at' not in cookies or 'JSESSIONID' not in cookies:
+                return None
+            
+            session = requests.Session()
+            session.cookies.update(cookies)
+            session.headers.update({
+                'csrf-token': cookies['JSESSIONID'].strip('"'),
+                # Plain JSON keeps profileView in the nested shape _parse_profile_view reads;
+                # the normalized media type flattens it into a {data, included} envelope
+                'accept': 'application/json',
+                'x-restli-protocol-version': '2.0.0',
+                'user-agent': self.driver.execute_script("return navigator.userAgent")
+            })
+            self._api_session = session
+        return self._api_session
     
-    def _extract_experience(self) -> str:
-        """Extract experience information"""
+    def _fetch_profile_api(self, profile_url: str) -> Optional[ProfileData]:
+        """Fetch a profile from the Voyager API instead of the rendered page"""
+        path = urlparse(profile_url).path.strip('/').split('/')
+        if len(path) < 2 or path[0] != 'in':
+            return None
+        
         try:
-            exp_section = self.driver.find_element(By.CSS_SELECTOR, "section[aria-label='Experience']")
-            exp_items = exp_section.find_elements(By.CSS_SELECTOR, "li.artdeco-list__item")[:3]
+            session = self._get_api_session()
+            if session is None:
+                return None
             
-            experience_list = []
-            for item in exp_items:
-                try:
-                    title = item.find_element(By.CSS_SELECTOR, "span[aria-hidden='true']").text.strip()
-                    company = item.find_element(By.CSS_SELECTOR, "span.t-14.t-normal").text.strip()
-                    experience_list.append(f"{title} at {company}")
-                except:
-                    continue
+            public_id = path[1]
+            response = session.get(f"{VOYAGER_API_URL}/identity/profiles/{public_id}/profileView", timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
             
-            return "; ".join(experience_list)
-        except:
-            return ""
+            response = session.get(
+                f"{VOYAGER_API_URL}/identity/profiles/{public_id}/skills",
+                params={'count': 100, 'start': 0},
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            skills = [skill['name'] for skill in response.json().get('elements', []) if skill.get('name')]
+        except (requests.RequestException, ValueError) as e:
+            logger.warning(f"Voyager API unavailable for {profile_url}: {e}")
+            return None
+        
+        return self._parse_profile_view(data, skills, profile_url)
     
-    def _extract_education(self) -> str:
-        """Extract education information"""
-        try:
-            edu_section = self.driver.find_element(By.CSS_SELECTOR, "section[aria-label='Education']")
-            edu_items = edu_section.find_elements(By.CSS_SELECTOR, "li.artdeco-list__item")[:2]
+    def _parse_profile_view(self, data: dict, skills: List[str], profile_url: str) -> Optional[ProfileData]:
+        """Build a ProfileData from a profileView response and the profile's skill names"""
+        info = data.get('profile', {})
+        name = f"{info.get('firstName', '')} {info.get('lastName', '')}".strip()
+        if not name:
+            return None
+        
+        positions = data.get('positionView', {}).get('elements', [])
+        schools = data.get('educationView', {}).get('elements', [])
+        experience = "; ".join(
+            f"{position.get('title', '')} at {position.get('companyName', '')}" for position in positions[:3]
+        )
+        education = "; ".join(
+            f"{school.get('degreeName', '')} from {school.get('schoolName', '')}" for school in schools[:2]
+        )
+        
+        match_score, matched_skills = self._match_profile(skills, info.get('headline', ''), info.get('summary', ''))
+        
+        return ProfileData(
+            name=name,
+            headline=info.get('headline', ''),
+            location=info.get('geoLocationName') or info.get('locationName', ''),
+            profile_url=profile_url,
+            current_company=positions[0].get('companyName', '') if positions else "",
+            experience=experience,
+            skills=skills,
+            skill_match_score=match_score,
+            required_skills_matched=matched_skills,
+            total_skills_count=len(skills),
+            about=info.get('summary', ''),
+            education=education
+        )
+    
+    def scrape_profiles_batch(self, profile_urls: List[str], workers: int = 4) -> List[Optional[ProfileData]]:
+        """Scrape profiles concurrently, each worker thread driving its own browser session"""
+        local = threading.local()
+        worker_scrapers = []
+        lock = threading.Lock()
+        
+        def scrape_one(profile_url: str) -> Optional[ProfileData]:
+            scraper = getattr(local, 'scraper', None)
+            if scraper is None:
+                scraper = LinkedInScraper(self.email, self.password, self.headless)
+                scraper.target_skills = self.target_skills
+                scraper.cache_path = self.cache_path
+                scraper.timeout = self.timeout
+                with lock:
+                    # Chrome locks a user-data-dir to one browser, so each worker gets its own
+                    scraper.chrome_profile_dir = f"{self.chrome_profile_dir}-{len(worker_scrapers)}"
+                    worker_scrapers.append(scraper)
+                local.scraper = scraper
+                # Safari allows only one WebDriver session at a time, so workers go straight to Chrome
+                scraper.setup_driver(use_safari=False)
+                scraper.login_to_linkedin()
             
-            education_list = []
-            for item in edu_items:
+            # Jittered pacing so parallel sessions don't hit LinkedIn in lockstep
+            time.sleep(random.uniform(self.delay_between_requests, 2 * self.delay_between_requests))
+            return scraper.scrape_profile(profile_url)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(scrape_one, profile_urls))
+        finally:
+            # Quit every browser first, so a failure closing one worker's cache or session can't leak the rest
+            for scraper in worker_scrapers:
+                scraper._quit_driver()
+            for scraper in worker_scrapers:
                 try:
-                    school = item.find_element(By.CSS_SELECTOR, "span[aria-hidden='true']").text.strip()
-                    degree = item.find_element(By.CSS_SELECTOR, "span.t-14.t-normal").text.strip()
-                    education_list.append(f"{degree} from {school}")
-                except:
-                    continue
-            
-            return "; ".join(education_list)
-        except:
-            return ""
+                    scraper.close()
+                except Exception as e:
+                    logger.warning(f"Error closing batch worker: {e}")
+    
+    def _extract_text(self, root, selector) -> str:
+        """Extract text from the first element matching a compiled selector"""
+        element = selector.select_one(root)
+        return element.get_text(" ", strip=True) if element else ""
+    
+    def _extract_section_items(self, soup, section_selector, limit: int) -> List[tuple]:
+        """Extract (title, subtitle) pairs from the first items of a profile section"""
+        section = section_selector.select_one(soup)
+        if not section:
+            return []
+        
+        items = []
+        for item in SECTION_ITEM_SELECTOR.select(section, limit=limit):
+            title = self._extract_text(item, ITEM_TITLE_SELECTOR)
+            subtitle = self._extract_text(item, ITEM_SUBTITLE_SELECTOR)
+            if title and subtitle:
+                items.append((title, subtitle))
+        return items
+    
+    def _extract_experience(self, soup) -> str:
+        """Extract experience information"""
+        items = self._extract_section_items(soup, PROFILE_SELECTORS['experience'], 3)
+        return "; ".join(f"{title} at {company}" for title, company in items)
+    
+    def _extract_education(self, soup) -> str:
+        """Extract education information"""
+        items = self._extract_section_items(soup, PROFILE_SELECTORS['education'], 2)
+        return "; ".join(f"{degree} from {school}" for school, degree in items)
     
     def _extract_skills(self) -> List[str]:
         """Extract skills from profile"""
         try:
             # Navigate to skills section
-            skills_link = self.driver.find_element(By.CSS_SELECTOR, "a[href*='/details/skills/']")
+            skills_link = self.driver.find_element(By.CSS_SELECTOR, SKILLS_LINK_CSS)
+            profile_page_url = self.driver.current_url
             skills_link.click()
-            time.sleep(2)
             
-            # Extract skills
-            skill_elements = self.driver.find_elements(By.CSS_SELECTOR, "span[aria-hidden='true']")
-            skills = [elem.text.strip() for elem in skill_elements if elem.text.strip()]
+            # Wait for the skills page to render instead of sleeping a fixed time
+            wait = WebDriverWait(self.driver, self.timeout)
+            wait.until(EC.url_changes(profile_page_url))
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, SKILL_ITEM_CSS)))
+            
+            # Extract skills from the main column only, skipping nav and sidebar spans;
+            # one script call replaces a lookup plus a .text round trip per element
+            skill_texts = self.driver.execute_script(SKILL_TEXTS_JS, f"main {SKILL_ITEM_CSS}")
+            skills = list(dict.fromkeys(text for text in skill_texts if text))
             
             # Go back to main profile
+            skills_page_url = self.driver.current_url
             self.driver.back()
-            time.sleep(1)
+            wait.until(EC.url_changes(skills_page_url))
             
             return skills
         except:
             return []
     
+    def _search_cache_key(self, search_request: JobSearchRequest) -> tuple:
+        """Build a hashable cache key from the search request parameters"""
+        return (
+            tuple(skill.lower() for skill in search_request.skills),
+            search_request.location.strip().lower(),
+            search_request.experience_level,
+            search_request.job_type,
+            search_request.company.strip().lower(),
+            search_request.limit
+        )
+    
     def search_jobs(self, search_request: JobSearchRequest) -> JobSearchResponse:
         """Search for jobs on LinkedIn"""
-        driver = None
+        # Serve identical searches from the cache instead of re-scraping
+        cache_key = self._search_cache_key(search_request)
+        cached = _search_cache.get(cache_key)
+        if cached and time.time() - cached[0] < SEARCH_CACHE_TTL:
+            logger.info("Returning cached job search results")
+            return cached[1]
+        
+        # Fall back to results persisted by an earlier run
+        cached_jobs = self._get_cached_jobs(search_request)
+        if cached_jobs is not None:
+            logger.info("Returning job search results from the on-disk cache")
+            return self._job_search_response(search_request, cached_jobs, cache_key)
+        
+        # Try the guest listing endpoint first; it needs no browser at all
+        job_containers = self._fetch_job_cards(search_request)
+        if job_containers:
+            logger.info(f"Fetched {len(job_containers)} job containers without a browser")
+            return self._build_job_search_response(search_request, job_containers, cache_key)
+        
         try:
-            driver = self.setup_driver()
+            # Keep one browser warm across searches, restarting it when it dies and now and then; close() quits it
+            self._drop_dead_driver()
+            if self.driver is None:
+                self.setup_driver()
+                self._close_at_exit()
+            elif self._driver_searches >= DRIVER_MAX_SEARCHES:
+                logger.info(f"Restarting the browser after {self._driver_searches} searches")
+                self._quit_driver()
+                self.setup_driver()
+            driver = self.driver
+            self._driver_searches += 1
             
             # Build search URL
             search_url = self._build_search_url(search_request)
             logger.info(f"Searching with URL: {search_url}")
             
             # Navigate to search page
-            driver.get(search_url)
-            time.sleep(self.delay_between_requests)
+            self._navigate(search_url, driver)
             
             # Wait for job listings to load
             try:
                 WebDriverWait(driver, self.timeout).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "jobs-search__results-list"))
+                    EC.presence_of_element_located((By.CLASS_NAME, JOB_RESULTS_LIST_CLASS))
                 )
             except TimeoutException:
                 logger.warning("Timeout waiting for job listings to load")
@@ -398,37 +883,14 @@ class LinkedInScraper:
                     message="Failed to load job listings - LinkedIn may be blocking requests"
                 )
             
-            # Parse the page with BeautifulSoup
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            # Parse only the result cards out of the page
+            soup = BeautifulSoup(driver.page_source, 'lxml', parse_only=JOB_CARD_PARSE_ONLY)
             
             # Find job listing containers
-            job_containers = soup.find_all('div', class_='base-card')
+            job_containers = JOB_CARD_SELECTOR.select(soup)
             logger.info(f"Found {len(job_containers)} job containers")
             
-            jobs = []
-            processed_count = 0
-            
-            for container in job_containers:
-                if processed_count >= search_request.limit:
-                    break
-                
-                job = self._extract_job_from_element(container, search_request.skills)
-                if job:
-                    jobs.append(job)
-                    processed_count += 1
-                
-                # Add delay between processing jobs
-                time.sleep(0.5)
-            
-            logger.info(f"Successfully scraped {len(jobs)} jobs")
-            
-            return JobSearchResponse(
-                success=True,
-                total_jobs_found=len(jobs),
-                jobs=jobs,
-                search_query=search_request,
-                message=f"Successfully found {len(jobs)} job listings"
-            )
+            return self._build_job_search_response(search_request, job_containers, cache_key)
             
         except WebDriverException as e:
             logger.error(f"WebDriver error during job search: {e}")
@@ -448,78 +910,108 @@ class LinkedInScraper:
                 search_query=search_request,
                 message=f"Unexpected error: {str(e)}"
             )
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except Exception as e:
-                    logger.warning(f"Error closing driver: {e}")
     
-    def _build_search_url(self, search_request: JobSearchRequest) -> str:
-        """Build LinkedIn job search URL from request parameters"""
-        params = {}
-        
-        # Keywords (skills)
-        if search_request.skills:
-            keywords = " OR ".join(search_request.skills)
-            params['keywords'] = keywords
+    def _fetch_job_cards(self, search_request: JobSearchRequest) -> list:
+        """Fetch job result cards from the guest listing endpoint over plain HTTP"""
+        params = _job_search_params(
+            tuple(search_request.skills),
+            search_request.location,
+            search_request.experience_level,
+            search_request.job_type,
+            search_request.company
+        )
         
-        # Location
-        if search_request.location:
-            params['location'] = search_request.location
+        # Request every page up front and read them back in order; an empty page ends the results
+        starts = range(0, search_request.limit, JOBS_GUEST_PAGE_SIZE)
+        job_containers = []
+        with requests.Session() as session, \
+                ThreadPoolExecutor(max_workers=max(1, min(len(starts), JOBS_GUEST_MAX_WORKERS))) as executor:
+            session.headers['user-agent'] = USER_AGENT
+            pages = [executor.submit(self._fetch_job_card_page, session, params, start) for start in starts]
+            for page in pages:
+                try:
+                    page_containers = page.result()
+                except requests.RequestException as e:
+                    if not job_containers:
+                        logger.warning(f"Guest job listing request failed, falling back to the browser: {e}")
+                        return []
+                    logger.warning(f"Guest job listing page failed, keeping earlier pages: {e}")
+                    break
+                if not page_containers:
+                    break
+                job_containers.extend(page_containers)
         
-        # Experience level mapping
-        experience_mapping = {
-            'internship': '1',
-            'entry_level': '2', 
-            'associate': '3',
-            'mid_senior': '4',
-            'director': '5'
-        }
-        if search_request.experience_level and search_request.experience_level in experience_mapping:
-            params['f_E'] = experience_mapping[search_request.experience_level]
+        return job_containers
+    
+    def _fetch_job_card_page(self, session: requests.Session, params: dict, start: int) -> list:
+        """Fetch one page of job result cards from the guest listing endpoint"""
+        response = session.get(JOBS_GUEST_API_URL, params=dict(params, start=str(start)), timeout=self.timeout)
+        response.raise_for_status()
+        page_soup = BeautifulSoup(response.text, 'lxml', parse_only=JOB_CARD_PARSE_ONLY)
+        return JOB_CARD_SELECTOR.select(page_soup)
+    
+    def _build_job_search_response(self, search_request: JobSearchRequest, job_containers: list,
+                                   cache_key: tuple) -> JobSearchResponse:
+        """Extract jobs from result cards, then build and cache the search response"""
+        # Pick the best-matching jobs from every card on the page before applying the limit
+        parsed_jobs = (self._extract_job_from_element(container, search_request.skills) for container in job_containers)
+        jobs = self.top_jobs(filter(None, parsed_jobs), search_request.limit)
         
-        # Job type mapping
-        job_type_mapping = {
-            'full_time': 'F',
-            'part_time': 'P',
-            'contract': 'C',
-            'temporary': 'T',
-            'volunteer': 'V'
-        }
-        if search_request.job_type and search_request.job_type in job_type_mapping:
-            params['f_JT'] = job_type_mapping[search_request.job_type]
+        logger.info(f"Successfully scraped {len(jobs)} jobs")
         
-        # Company
-        if search_request.company:
-            params['f_C'] = search_request.company
+        if jobs:
+            self._cache_jobs(search_request, jobs)
+        return self._job_search_response(search_request, jobs, cache_key)
+    
+    def _job_search_response(self, search_request: JobSearchRequest, jobs: List[JobListing],
+                             cache_key: tuple) -> JobSearchResponse:
+        """Wrap job listings in a successful response and keep it in the in-memory cache"""
+        response = JobSearchResponse(
+            success=True,
+            total_jobs_found=len(jobs),
+            jobs=jobs,
+            search_query=search_request,
+            message=f"Successfully found {len(jobs)} job listings"
+        )
         
-        # Time filter (recent jobs)
-        params['f_TPR'] = 'r86400'  # Last 24 hours
-        params['start'] = '0'
+        # Evict the oldest entry once the cache is full
+        if len(_search_cache) >= SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.pop(next(iter(_search_cache)))
+        _search_cache[cache_key] = (time.time(), response)
         
-        query_string = urlencode(params, quote_via=quote)
-        return f"{self.base_url}?{query_string}"
+        return response
+    
+    def _build_search_url(self, search_request: JobSearchRequest) -> str:
+        """Build LinkedIn job search URL from request parameters"""
+        return _job_search_url(
+            self.base_url,
+            tuple(search_request.skills),
+            search_request.location,
+            search_request.experience_level,
+            search_request.job_type,
+            search_request.company
+        )
     
     def _extract_job_from_element(self, job_element, search_skills: List[str]) -> Optional[JobListing]:
         """Extract job information from a job listing element"""
         try:
             # Extract basic job information
-            title_element = job_element.find('h3', class_='base-search-card__title')
+            title_element = JOB_CARD_SELECTORS['title'].select_one(job_element)
             title = title_element.get_text().strip() if title_element else "N/A"
             
-            company_element = job_element.find('h4', class_='base-search-card__subtitle')
+            company_element = JOB_CARD_SELECTORS['company'].select_one(job_element)
             company = company_element.get_text().strip() if company_element else "N/A"
             
-            location_element = job_element.find('span', class_='job-search-card__location')
+            location_element = JOB_CARD_SELECTORS['location'].select_one(job_element)
             location = location_element.get_text().strip() if location_element else "N/A"
             
             # Extract job URL
-            job_link = job_element.find('a', class_='base-card__full-link')
+            job_link = JOB_CARD_SELECTORS['link'].select_one(job_element)
             job_url = job_link.get('href') if job_link else ""
             
-            # Calculate skill match
-            match_score, matched_skills = self.calculate_skill_match(search_skills, search_skills)
+            # Score the searched skills against what the card says about the job;
+            # matching the search skills against themselves always gave 100%
+            match_score, matched_skills = self.calculate_skill_match([title], search_skills)
             
             return JobListing(
                 title=title,
@@ -544,19 +1036,70 @@ class LinkedInScraper:
             timestamp=datetime.now().isoformat()
         )
     
+    def _excel_column_widths(self, df: "pd.DataFrame") -> "pd.Series":
+        """Size every column to its longest value or header in one vectorized pass"""
+        import pandas as pd
+        
+        value_widths = pd.to_numeric(df.astype(str).apply(lambda column: column.str.len()).max()).fillna(0)
+        header_widths = df.columns.str.len().to_series(index=df.columns)
+        return value_widths.combine(header_widths, max).add(2).clip(upper=EXCEL_MAX_COLUMN_WIDTH).astype(int)
+    
+    def score_profiles(self, profiles: List[ProfileData]) -> List[ProfileData]:
+        """Score each profile against the current target skills, updating it in place"""
+        # One matcher call per profile; skill_match's cache lets profiles with identical skills and text share a result
+        for profile in profiles:
+            profile.skill_match_score, profile.required_skills_matched = self._match_profile(
+                profile.skills, profile.headline, profile.about
+            )
+        return profiles
+    
+    def top_jobs(self, jobs: Iterable[JobListing], k: int) -> List[JobListing]:
+        """Return the k best-matching jobs, highest score first; equal scores keep LinkedIn's order"""
+        return heapq.nlargest(k, jobs, key=lambda job: job.match_score)
+    
     def export_to_excel(self, data: List[ProfileData], filename: str = None) -> str:
         """Export profile data to Excel file"""
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"linkedin_profiles_{timestamp}.xlsx"
         
+        # Imported here so scraping runs don't pay pandas' startup cost
+        import pandas as pd
+        import xlsxwriter
+        
         try:
-            # Convert to DataFrame
-            df_data = [profile.to_dict() for profile in data]
-            df = pd.DataFrame(df_data)
+            # Fill in scores only for profiles that were never scored, i.e. with neither a score nor
+            # matched skills set; a score or match list the caller supplied is exported as given
+            self.score_profiles([
+                profile for profile in data
+                if not profile.skill_match_score and profile.required_skills_matched is None
+            ])
             
-            # Export to Excel
-            df.to_excel(filename, index=False, engine='openpyxl')
+            # Build the DataFrame column by column, then format derived fields in bulk
+            df = pd.DataFrame({
+                label: [getattr(profile, attr) for profile in data]
+                for label, attr in ProfileData.EXPORT_COLUMNS
+            }, dtype=object)
+            df['Email'] = df['Email'].mask(~df['Email'].astype(bool), 'Not Available')
+            df['Skills Matched'] = df['Skills Matched'].str.join(', ').fillna('')
+            df['Match Score (%)'] = pd.to_numeric(df['Match Score (%)']).round(1)
+            df['All Skills'] = df['All Skills'].str.join(', ').fillna('')
+            about = df['About']
+            df['About'] = about.mask(about.str.len() > 200, about.str.slice(0, 200) + '...')
+            
+            # Stream rows to disk in order; constant_memory keeps only the current row in memory
+            workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+            try:
+                worksheet = workbook.add_worksheet(EXCEL_SHEET_NAME)
+                
+                for index, width in enumerate(self._excel_column_widths(df)):
+                    worksheet.set_column(index, index, width)
+                
+                worksheet.write_row(0, 0, df.columns, workbook.add_format(EXCEL_HEADER_FORMAT))
+                for row_index, row in enumerate(df.astype(object).where(df.notna(), None).itertuples(index=False), start=1):
+                    worksheet.write_row(row_index, 0, row)
+            finally:
+                workbook.close()
             logger.info(f"Data exported to {filename}")
             return filename
             
@@ -564,56 +1107,75 @@ class LinkedInScraper:
             logger.error(f"Error exporting to Excel: {e}")
             raise
     
-    def close(self):
-        """Close the web driver"""
+    def _quit_driver(self):
+        """Quit the web driver, if one is running"""
         if self.driver:
             try:
                 self.driver.quit()
             except Exception as e:
                 logger.warning(f"Error closing driver: {e}")
+            finally:
+                self.driver = None
+                self._driver_searches = 0
+                self.logged_in = False
+    
+    def close(self):
+        """Close the web driver"""
+        self._quit_driver()
+        
+        if self._api_session is not None:
+            self._api_session.close()
+            self._api_session = None
+        
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
 
 
-# Example usage functions
-def scrape_profiles(search_query: str, max_profiles: int = 10, target_skills: List[str] = None):
-    """Scrape LinkedIn profiles based on search query"""
+@lru_cache(maxsize=1)
+def get_scraper() -> LinkedInScraper:
+    """Return the shared scraper instance used by the module-level helpers"""
     scraper = LinkedInScraper(headless=False)
+    # The shared browser stays open between helper calls and is quit when the interpreter exits
+    scraper._close_at_exit()
+    return scraper
+
+
+# Example usage functions
+def scrape_profiles(search_queries, max_profiles: int = 10, target_skills: List[str] = None):
+    """Scrape LinkedIn profiles for one or more search queries in a single browser session"""
+    if isinstance(search_queries, str):
+        search_queries = [search_queries]
     
-    try:
-        scraper.setup_driver()
-        
-        if target_skills:
-            scraper.target_skills = target_skills
-        
+    # The search is still a placeholder, so no browser is started; real scraping calls start_session() first
+    scraper = get_scraper()
+    # The scraper is shared, so reset the skills instead of inheriting the previous caller's
+    scraper.target_skills = list(target_skills or DEFAULT_TARGET_SKILLS)
+    
+    for search_query in search_queries:
         # This would need to be implemented based on LinkedIn search
         # For now, this is a placeholder
         logger.info(f"Would scrape {max_profiles} profiles for: {search_query}")
-        
-    finally:
-        scraper.close()
 
 
 def search_jobs(skills: List[str], location: str = "", limit: int = 10):
-    """Search for jobs on LinkedIn"""
-    scraper = LinkedInScraper(headless=False)
+    """Search for jobs on LinkedIn, keeping the shared scraper's browser warm between calls"""
+    scraper = get_scraper()
     
-    try:
-        request = JobSearchRequest(
-            skills=skills,
-            location=location,
-            limit=limit
-        )
-        
-        result = scraper.search_jobs(request)
-        
-        if result.success:
-            logger.info(f"Found {len(result.jobs)} jobs")
-            for job in result.jobs:
-                print(f"- {job.title} at {job.company} ({job.location})")
-        else:
-            logger.error(f"Job search failed: {result.message}")
-            
-    finally:
-        scraper.close()
+    request = JobSearchRequest(
+        skills=skills,
+        location=location,
+        limit=limit
+    )
+    
+    result = scraper.search_jobs(request)
+    
+    if result.success:
+        logger.info(f"Found {len(result.jobs)} jobs")
+        if result.jobs:
+            print("\n".join(JOB_LINE_TEMPLATE.format(job=job) for job in result.jobs))
+    else:
+        logger.error(f"Job search failed: {result.message}")
 
 
 if __name__ == "__main__":
@@ -684,11 +1246,12 @@ if __name__ == "__main__":
                 print("👤 PROFILE SCRAPING")
                 print("=" * 40)
                 
-                print("\nEnter the search query for profiles.")
+                print("\nEnter the search query for profiles (separate several queries with ';').")
                 print("Examples: 'Oracle PL/SQL developers', 'Python developers in San Francisco'")
                 query = input("\nEnter search query: ").strip()
+                queries = [q.strip() for q in query.split(';') if q.strip()]
                 
-                if not query:
+                if not queries:
                     print("❌ No search query provided. Please try again.")
                     continue
                 
@@ -697,12 +1260,12 @@ if __name__ == "__main__":
                 except ValueError:
                     max_profiles = 10
                 
-                print(f"\n👤 Searching for profiles: {query}")
+                print(f"\n👤 Searching for profiles: {', '.join(queries)}")
                 print(f"📊 Max profiles: {max_profiles}")
                 print("\n⏳ Please wait...")
                 
-                # Perform profile scraping
-                scrape_profiles(query, max_profiles)
+                # Perform profile scraping; all queries share one browser session
+                scrape_profiles(queries, max_profiles)
                 
             elif choice == "3":
                 print("\n👋 Thank you for using LinkedIn Scraper!")
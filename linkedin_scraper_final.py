@@ -4,23 +4,213 @@ LinkedIn Profile Scraper - Final Production Version
 Scrapes LinkedIn profiles based on user input for skills, location, and experience
 """
 
-import json
 import csv
-import time
 import os
+import time
+import sqlite3
+import multiprocessing
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from urllib.parse import urlencode, quote
+from multiprocessing.util import Finalize
+
+import orjson
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
 
-@dataclass
+from scraper_common import (
+    CHROME_CONTENT_PREFS, CHROME_PROFILE_DIR, DATACLASS_OPTIONS, FEED_URL, LOGIN_REDIRECT_MARKERS,
+    PROFILE_CACHE_PATH, PROFILE_CACHE_TTL, PROFILE_NAME_CSS, block_page_resources, skill_match
+)
+
+PEOPLE_SEARCH_URL = "https://www.linkedin.com/search/results/people/"
+
+# Markup whose text never shows on the page: scripts, embedded JSON and screen-reader duplicates
+NON_VISIBLE_TEXT_CSS = "script, style, code, .visually-hidden"
+
+# Profile page sections, each with fallback selectors tried in order
+ABOUT_SELECTORS = [
+    # Modern LinkedIn selectors
+    "section[aria-label='About'] div.display-flex.ph5.pv3",
+    "section[aria-label='About'] div.pv-shared-text-with-see-more",
+    "section[aria-label='About'] span.break-words",
+    "section[aria-label='About'] div.text-body-medium",
+    # Alternative selectors
+    "section[aria-label='About'] div.pv-shared-text",
+    "section[aria-label='About'] div.text-body-medium.break-words",
+    "section[aria-label='About'] div.break-words",
+    # Generic text selectors
+    "section[aria-label='About'] div",
+    "section[aria-label='About'] p",
+    "section[aria-label='About'] span"
+]
+HEADLINE_SELECTORS = [
+    "div.text-body-medium.break-words",
+    "div.text-body-medium",
+    "div.break-words",
+    "span.text-body-medium",
+    "div[data-section='headline']",
+    "h2.text-body-medium"
+]
+
+EXPERIENCE_SECTION_SELECTORS = [
+    "section[aria-label='Experience']",
+    "section[data-section='experience']",
+    "section.experience-section"
+]
+EXPERIENCE_TITLE_SELECTORS = [
+    "span[aria-hidden='true']",
+    "h3",
+    ".t-bold",
+    ".experience__title",
+    "span.t-16.t-black.t-bold"
+]
+EXPERIENCE_COMPANY_SELECTORS = [
+    "span.t-14.t-normal",
+    ".experience__company",
+    ".t-14.t-black--light",
+    "span.t-14"
+]
+EDUCATION_SECTION_SELECTORS = [
+    "section[aria-label='Education']",
+    "section[data-section='education']",
+    "section.education-section"
+]
+EDUCATION_SCHOOL_SELECTORS = [
+    "span[aria-hidden='true']",
+    "h3",
+    ".t-bold",
+    ".education__school",
+    "span.t-16.t-black.t-bold"
+]
+EDUCATION_DEGREE_SELECTORS = [
+    "span.t-14.t-normal",
+    ".education__degree",
+    ".t-14.t-black--light",
+    "span.t-14"
+]
+
+SKILLS_LINK_SELECTORS = [
+    "a[href*='/details/skills/']",
+    "a[href*='skills']",
+    "a[data-control-name='skill_details']",
+    "a[aria-label*='skill']"
+]
+SKILL_ITEM_SELECTORS = [
+    "span[aria-hidden='true']",
+    ".skill-category-entity__name-text",
+    ".skill-category-entity__name",
+    ".skill-category-entity__skill-name",
+    "span.t-bold",
+    ".t-16.t-black.t-bold"
+]
+
+# Skills looked for in the page text when the skills page cannot be read
+COMMON_SKILLS = [
+    'python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'angular', 'vue',
+    'node.js', 'django', 'flask', 'spring', 'oracle', 'mysql', 'postgresql', 'mongodb',
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'agile', 'scrum'
+]
+
+# Search result cards and the fallback selectors for each card field
+SEARCH_CARD_SELECTORS = [
+    "li.search-result",
+    ".search-result",
+    ".search-result__card",
+    "[data-test-search-result]",
+    ".search-results__item"
+]
+SEARCH_CARD_FIELD_SELECTORS = {
+    'name': [
+        "span.name-and-icon",
+        ".search-result__title",
+        "h3",
+        ".search-result__name",
+        "[data-test-search-result-name]"
+    ],
+    'headline': [
+        "p.search-result__info",
+        ".search-result__headline",
+        ".search-result__subtitle",
+        "p",
+        ".search-result__description"
+    ],
+    'location': [
+        "p.search-result__location",
+        ".search-result__location",
+        ".search-result__subtitle",
+        "[data-test-search-result-location]"
+    ],
+    'company': [
+        "p.search-result__company",
+        ".search-result__company",
+        ".search-result__subtitle",
+        "[data-test-search-result-company]"
+    ]
+}
+
+# Reads every search result card in one WebDriver round trip. Arguments: card selectors,
+# field selectors, limit. Falls back to bare profile links when no card selector matches
+SEARCH_CARDS_JS = """
+const [cardSelectors, fieldSelectors, limit] = arguments;
+let cards = [];
+let matchedSelector = null;
+for (const selector of cardSelectors) {
+    cards = Array.from(document.querySelectorAll(selector));
+    if (cards.length) {
+        matchedSelector = selector;
+        break;
+    }
+}
+if (!cards.length) {
+    cards = Array.from(document.querySelectorAll("a[href*='/in/']"));
+}
+const firstText = (card, selectors) => {
+    for (const selector of selectors) {
+        const element = card.querySelector(selector);
+        const text = element ? element.innerText.trim() : '';
+        if (text) {
+            return text;
+        }
+    }
+    return '';
+};
+return {
+    selector: matchedSelector,
+    total: cards.length,
+    cards: cards.slice(0, limit).map(card => {
+        const link = card.querySelector('a');
+        const fields = {
+            raw_text: card.innerText || '',
+            href: card.href || '',
+            link_href: link ? link.href : ''
+        };
+        for (const [field, selectors] of Object.entries(fieldSelectors)) {
+            fields[field] = firstText(card, selectors);
+        }
+        return fields;
+    })
+};
+"""
+
+# Menu choice -> experience level label
+EXPERIENCE_LEVELS = {
+    "1": "Internship",
+    "2": "Entry Level",
+    "3": "Associate",
+    "4": "Mid-Senior",
+    "5": "Director",
+    "6": "Executive"
+}
+
+@dataclass(**DATACLASS_OPTIONS)
 class ProfileData:
     """Store LinkedIn profile data"""
     name: str
@@ -29,9 +219,9 @@ class ProfileData:
     profile_url: str = ""
     current_company: str = ""
     experience: str = ""
-    skills: List[str] = None
+    skills: List[str] = field(default_factory=list)
     skill_match_score: float = 0.0
-    required_skills_matched: List[str] = None
+    required_skills_matched: List[str] = field(default_factory=list)
     total_skills_count: int = 0
     about: str = ""
     education: str = ""
@@ -49,10 +239,10 @@ class ProfileData:
             'Location': self.location,
             'Experience Summary': self.experience,
             'Education': self.education,
-            'Skills Matched': ', '.join(self.required_skills_matched) if self.required_skills_matched else '',
+            'Skills Matched': ', '.join(self.required_skills_matched),
             'Match Score (%)': round(self.skill_match_score, 1),
             'Total Skills': self.total_skills_count,
-            'All Skills': ', '.join(self.skills) if self.skills else '',
+            'All Skills': ', '.join(self.skills),
             'About': self.about[:200] + '...' if self.about and len(self.about) > 200 else self.about,
             'Profile URL': self.profile_url,
             'Connections': self.connections,
@@ -73,37 +263,40 @@ class LinkedInScraper:
         self.wait_time = 3
         self.timeout = 10
         self.delay_between_requests = 2
+        self.max_parallel_tabs = 3
+        self.chrome_profile_dir = CHROME_PROFILE_DIR
+        self.cache_path = PROFILE_CACHE_PATH
+        self._cache_conn = None
+        self.logged_in = False
         
-    def setup_driver(self):
+    def __enter__(self):
+        """Start one browser session and log in once for a batch of searches"""
+        self.setup_driver()
+        self.logged_in = self.login_to_linkedin()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+    
+    def setup_driver(self, use_safari: bool = True):
         """Setup Chrome driver with anti-detection measures"""
-        try:
-            # Try Safari first (macOS native)
-            self.driver = webdriver.Safari()
-            print("✅ Using Safari WebDriver")
-        except Exception as e:
-            print(f"⚠️  Safari failed: {e}")
-            print("🔄 Falling back to Chrome...")
-            
-            # Fallback to Chrome
-            options = Options()
-            if self.headless:
-                options.add_argument("--headless")
-                
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument("--window-size=1920,1080")
-            options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
-            
-            self.driver = webdriver.Chrome(options=options)
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            print("✅ Using Chrome WebDriver")
+        if not use_safari:
+            self._setup_chrome_driver()
+        else:
+            try:
+                # Try Safari first (macOS native)
+                self.driver = webdriver.Safari()
+                print("✅ Using Safari WebDriver")
+            except Exception as e:
+                print(f"⚠️  Safari failed: {e}")
+                print("🔄 Falling back to Chrome...")
+                self._setup_chrome_driver()
         
         # Set window size and bring to front
         self.driver.set_window_size(1920, 1080)
         self.driver.maximize_window()
+        self.driver.set_page_load_timeout(self.timeout)
         
         # Bring browser to front
         try:
@@ -113,19 +306,62 @@ class LinkedInScraper:
             
         return self.driver
     
+    def _setup_chrome_driver(self):
+        """Start Chrome on this scraper's profile directory, honouring headless"""
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless")
+            
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option('useAutomationExtension', False)
+        options.add_argument("--window-size=1920,1080")
+        options.add_argument("user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36")
+        options.add_argument(f"--user-data-dir={os.path.abspath(self.chrome_profile_dir)}")
+        options.add_argument("--profile-directory=Default")
+        options.add_experimental_option("prefs", CHROME_CONTENT_PREFS)
+        options.page_load_strategy = 'eager'
+        
+        self.driver = webdriver.Chrome(options=options)
+        block_page_resources(self.driver)
+        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        print("✅ Using Chrome WebDriver")
+    
+    def _load_page(self, url: str):
+        """Load a page in the current tab, cutting it off at the page load timeout"""
+        try:
+            self.driver.get(url)
+        except TimeoutException:
+            print(f"⚠️  Page load timed out, stopping it: {url}")
+            self.driver.execute_script("window.stop();")
+    
+    def is_logged_in(self) -> bool:
+        """Check whether the browser already has a valid LinkedIn session"""
+        try:
+            self._load_page(FEED_URL)
+            return "feed" in self.driver.current_url
+        except Exception:
+            return False
+    
     def login_to_linkedin(self):
         """Login to LinkedIn"""
+        if self.is_logged_in():
+            print("✅ Reusing saved LinkedIn session")
+            return True
+            
         if not self.email or not self.password:
             print("❌ LinkedIn credentials not provided. Please set LINKEDIN_EMAIL and LINKEDIN_PASSWORD environment variables.")
             return False
             
         try:
             print("🔑 Logging into LinkedIn...")
-            self.driver.get("https://www.linkedin.com/login")
-            time.sleep(2)
+            self._load_page("https://www.linkedin.com/login")
+            wait = WebDriverWait(self.driver, self.timeout)
             
-            # Enter email
-            email_field = self.driver.find_element(By.ID, "username")
+            # Enter email once the form has rendered
+            email_field = wait.until(EC.presence_of_element_located((By.ID, "username")))
             email_field.send_keys(self.email)
             
             # Enter password
@@ -136,7 +372,11 @@ class LinkedInScraper:
             login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             login_button.click()
             
-            time.sleep(5)
+            # Wait for LinkedIn to land on the feed, the network page or a checkpoint
+            try:
+                wait.until(lambda driver: any(marker in driver.current_url for marker in LOGIN_REDIRECT_MARKERS))
+            except TimeoutException:
+                pass
             
             # Check if login was successful
             if "feed" in self.driver.current_url or "mynetwork" in self.driver.current_url:
@@ -154,33 +394,19 @@ class LinkedInScraper:
         """Calculate skill match score between profile and target skills"""
         if not target_skills or not profile_skills:
             return 0.0, []
-            
-        # Normalize skills for comparison
-        profile_skills_lower = [skill.lower().strip() for skill in profile_skills]
-        target_skills_lower = [skill.lower().strip() for skill in target_skills]
         
-        # Find matching skills
-        matched_skills = []
-        for target_skill in target_skills_lower:
-            for profile_skill in profile_skills_lower:
-                if target_skill in profile_skill or profile_skill in target_skill:
-                    matched_skills.append(target_skill)
-                    break
-        
-        # Calculate match percentage
-        match_score = (len(matched_skills) / len(target_skills)) * 100 if target_skills else 0
-        
-        return match_score, matched_skills
+        # Same whole-word matcher as linkedin_scraper.py, so scores are comparable across both tools
+        match_score, matched_skills = skill_match(tuple(profile_skills), tuple(target_skills))
+        return match_score, list(matched_skills)
     
     def search_profiles(self, skills: List[str], location: str = "", experience: str = "", limit: int = 20):
         """Search for LinkedIn profiles based on criteria"""
         try:
             # Build search URL
-            search_query = " OR ".join(skills)
-            search_url = f"https://www.linkedin.com/search/results/people/?keywords={search_query.replace(' ', '%20')}"
-            
+            params = {'keywords': " OR ".join(skills)}
             if location:
-                search_url += f"&location={location.replace(' ', '%20')}"
+                params['location'] = location
+            search_url = f"{PEOPLE_SEARCH_URL}?{urlencode(params, quote_via=quote)}"
             
             print(f"🔍 Searching for profiles with skills: {', '.join(skills)}")
             if location:
@@ -190,8 +416,7 @@ class LinkedInScraper:
             print(f"🌐 Search URL: {search_url}")
             
             # Navigate to search page
-            self.driver.get(search_url)
-            time.sleep(5)
+            self._load_page(search_url)
             
             # Wait for search results to load
             try:
@@ -200,10 +425,6 @@ class LinkedInScraper:
                 )
                 print("✅ Search results loaded")
                 
-                # Add delay so user can see the page
-                print("⏳ Waiting 3 seconds so you can see the search results...")
-                time.sleep(3)
-                
             except TimeoutException:
                 print("⚠️  Timeout waiting for search results")
                 return []
@@ -222,87 +443,153 @@ class LinkedInScraper:
         profiles = []
         
         try:
-            # Find profile cards using multiple selectors
-            profile_cards = []
-            possible_selectors = [
-                "li.search-result",
-                ".search-result",
-                ".search-result__card",
-                "[data-test-search-result]",
-                ".search-results__item"
-            ]
-            
-            for selector in possible_selectors:
-                try:
-                    profile_cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if profile_cards:
-                        print(f"📊 Found {len(profile_cards)} profile cards with selector: {selector}")
-                        break
-                except:
-                    continue
+            # Find profile cards using multiple selectors and read all their fields in one script call
+            results = self.driver.execute_script(
+                SEARCH_CARDS_JS, SEARCH_CARD_SELECTORS, SEARCH_CARD_FIELD_SELECTORS, limit
+            )
+            profile_cards = results['cards']
             
-            if not profile_cards:
+            if results['selector']:
+                print(f"📊 Found {results['total']} profile cards with selector: {results['selector']}")
+            else:
                 # Fallback: look for any clickable profile links
-                profile_cards = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='/in/']")
-                print(f"🔗 Found {len(profile_cards)} potential profile links")
+                print(f"🔗 Found {results['total']} potential profile links")
             
-            print(f"📊 Processing up to {min(limit, len(profile_cards))} profiles...")
+            print(f"📊 Processing up to {len(profile_cards)} profiles...")
             
-            for i, card in enumerate(profile_cards[:limit]):
+            # Read every card first, while the search results page is still live
+            for i, card in enumerate(profile_cards):
                 try:
                     profile_data = self._extract_single_profile(card, target_skills, i + 1)
                     if profile_data:
-                        # Extract detailed profile information
-                        if profile_data.profile_url and profile_data.profile_url != "N/A":
-                            print(f"   🔍 Extracting detailed profile for: {profile_data.name}")
-                            detailed_info = self.extract_detailed_profile(profile_data.profile_url)
-                            
-                            # Update profile data with detailed information
-                            profile_data.headline = detailed_info.get('headline', 'N/A')
-                            profile_data.about = detailed_info['about']
-                            profile_data.experience = detailed_info['experience']
-                            profile_data.education = detailed_info['education']
-                            profile_data.connections = detailed_info['connections']
-                            profile_data.profile_summary = detailed_info['profile_summary']
-                            profile_data.detailed_skills = detailed_info['skills']
-                            
-                            # Update skill match score with detailed skills
-                            if detailed_info['skills'] != "Not available":
-                                skills_list = [skill.strip() for skill in detailed_info['skills'].split(',')]
-                                match_score, matched_skills = self.calculate_skill_match(skills_list, target_skills)
-                                profile_data.skill_match_score = match_score
-                                profile_data.required_skills_matched = matched_skills
-                                profile_data.total_skills_count = len(skills_list)
-                        
                         profiles.append(profile_data)
-                        print(f"   ✅ Profile {i+1}: {profile_data.name}")
-                    
-                    # Add delay between extractions
-                    time.sleep(1)  # Increased delay for detailed scraping
-                    
                 except Exception as e:
                     print(f"   ❌ Error extracting profile {i+1}: {e}")
                     continue
-                    
+            
+            # Load detailed profiles in batches of background tabs; recently extracted ones come from the cache
+            detailed = []
+            for profile_data in profiles:
+                if not profile_data.profile_url or profile_data.profile_url == "N/A":
+                    continue
+                cached_info = self._get_cached_details(profile_data.profile_url)
+                if cached_info:
+                    print(f"   ♻️  Using cached details for: {profile_data.name}")
+                    self._apply_detailed_info(profile_data, cached_info, target_skills)
+                else:
+                    detailed.append(profile_data)
+            search_handle = self.driver.current_window_handle
+            for start in range(0, len(detailed), self.max_parallel_tabs):
+                batch = detailed[start:start + self.max_parallel_tabs]
+                handles = self._open_profile_tabs([p.profile_url for p in batch])
+                
+                try:
+                    for profile_data, handle in zip(batch, handles):
+                        try:
+                            print(f"   🔍 Extracting detailed profile for: {profile_data.name}")
+                            if handle:
+                                self.driver.switch_to.window(handle)
+                            else:
+                                self.driver.switch_to.new_window('tab')
+                                block_page_resources(self.driver)
+                            detailed_info = self.extract_detailed_profile(profile_data.profile_url, navigate=not handle)
+                            self._apply_detailed_info(profile_data, detailed_info, target_skills)
+                            print(f"   ✅ Profile: {profile_data.name}")
+                        except Exception as e:
+                            print(f"   ❌ Error extracting profile {profile_data.name}: {e}")
+                        finally:
+                            try:
+                                if self.driver.current_window_handle != search_handle:
+                                    self.driver.close()
+                            except:
+                                pass
+                            self.driver.switch_to.window(search_handle)
+                finally:
+                    # A failed switch or extraction must not leave the rest of the batch's tabs open
+                    self._close_tabs([handle for handle in handles if handle], search_handle)
+        
         except Exception as e:
             print(f"❌ Error extracting profiles: {e}")
         
         return profiles
     
-    def _extract_single_profile(self, card, target_skills: List[str], index: int) -> Optional[ProfileData]:
-        """Extract data from a single profile card"""
+    def _open_profile_tabs(self, profile_urls: List[str]) -> List[Optional[str]]:
+        """Open each profile URL in a background tab so the pages load concurrently"""
+        handles = []
+        origin_handle = self.driver.current_window_handle
+        try:
+            for url in profile_urls:
+                known_handles = set(self.driver.window_handles)
+                handle = None
+                try:
+                    # Open the tab blank so resource blocking is in place before the profile starts loading
+                    self.driver.execute_script("window.open('about:blank', '_blank');")
+                    new_handles = [h for h in self.driver.window_handles if h not in known_handles]
+                    if new_handles:
+                        handle = new_handles[0]
+                        self.driver.switch_to.window(handle)
+                        block_page_resources(self.driver)
+                        self.driver.execute_script("window.location.href = arguments[0];", url)
+                except:
+                    if handle:
+                        try:
+                            self.driver.close()
+                        except:
+                            pass
+                    handle = None
+                # None means the pop-up was blocked; the profile is loaded on demand instead
+                handles.append(handle)
+                self.driver.switch_to.window(origin_handle)
+        except:
+            # The caller never gets these handles, so close the tabs opened so far here
+            self._close_tabs([handle for handle in handles if handle], origin_handle)
+            raise
+        return handles
+    
+    def _close_tabs(self, handles: List[str], return_handle: str):
+        """Close whichever of the given tabs are still open, then switch back to return_handle"""
+        try:
+            open_handles = set(self.driver.window_handles)
+        except:
+            open_handles = set(handles)
+        for handle in handles:
+            if handle in open_handles and handle != return_handle:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except:
+                    pass
+        try:
+            self.driver.switch_to.window(return_handle)
+        except:
+            pass
+    
+    def _apply_detailed_info(self, profile_data: ProfileData, detailed_info: Dict[str, str], target_skills: List[str]):
+        """Update card-level profile data with details from the profile page"""
+        profile_data.headline = detailed_info.get('headline', 'N/A')
+        profile_data.about = detailed_info['about']
+        profile_data.experience = detailed_info['experience']
+        profile_data.education = detailed_info['education']
+        profile_data.connections = detailed_info['connections']
+        profile_data.profile_summary = detailed_info['profile_summary']
+        profile_data.detailed_skills = detailed_info['skills']
+        
+        # Update skill match score with detailed skills
+        if detailed_info['skills'] != "Not available":
+            skills_list = [skill.strip() for skill in detailed_info['skills'].split(',')]
+            match_score, matched_skills = self.calculate_skill_match(skills_list, target_skills)
+            profile_data.skill_match_score = match_score
+            profile_data.required_skills_matched = matched_skills
+            profile_data.total_skills_count = len(skills_list)
+    
+    def _extract_single_profile(self, card: Dict[str, str], target_skills: List[str], index: int) -> Optional[ProfileData]:
+        """Extract data from a single profile card's fields, as read by SEARCH_CARDS_JS"""
         try:
             # Get raw text for debugging
-            raw_text = card.text if hasattr(card, 'text') else ""
+            raw_text = card['raw_text'].strip()
             
             # Extract name
-            name = self._extract_text_from_card(card, [
-                "span.name-and-icon",
-                ".search-result__title",
-                "h3",
-                ".search-result__name",
-                "[data-test-search-result-name]"
-            ])
+            name = card['name']
             
             if not name:
                 # Try to extract from raw text
@@ -318,33 +605,11 @@ class LinkedInScraper:
             if not name:
                 return None
             
-            # Extract headline
-            headline = self._extract_text_from_card(card, [
-                "p.search-result__info",
-                ".search-result__headline",
-                ".search-result__subtitle",
-                "p",
-                ".search-result__description"
-            ])
-            
-            # Extract location
-            location = self._extract_text_from_card(card, [
-                "p.search-result__location",
-                ".search-result__location",
-                ".search-result__subtitle",
-                "[data-test-search-result-location]"
-            ])
-            
-            # Extract profile URL
+            # Extract headline, location, profile URL and company
+            headline = card['headline']
+            location = card['location']
             profile_url = self._extract_profile_url(card)
-            
-            # Extract company
-            company = self._extract_text_from_card(card, [
-                "p.search-result__company",
-                ".search-result__company",
-                ".search-result__subtitle",
-                "[data-test-search-result-company]"
-            ])
+            company = card['company']
             
             # Calculate skill match
             # For now, we'll use a simple approach - you can enhance this later
@@ -367,43 +632,18 @@ class LinkedInScraper:
             print(f"   ❌ Error in profile extraction: {e}")
             return None
     
-    def _extract_text_from_card(self, card, selectors: List[str]) -> str:
-        """Extract text using multiple selectors"""
-        for selector in selectors:
-            try:
-                element = card.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text:
-                    return text
-            except:
-                continue
-        return ""
-    
-    def _extract_profile_url(self, card) -> str:
+    def _extract_profile_url(self, card: Dict[str, str]) -> str:
         """Extract profile URL from card"""
-        try:
-            # Try to get href from the card itself
-            profile_url = card.get_attribute('href')
+        # Prefer the card's own href, then the first link inside it
+        for profile_url in (card['href'], card['link_href']):
             if profile_url and '/in/' in profile_url:
                 # Clean the URL by removing miniProfileUrn parameter
-                clean_url = profile_url.split('?')[0] if '?' in profile_url else profile_url
-                return clean_url
-            
-            # Try to find a link within the card
-            link_elem = card.find_element(By.CSS_SELECTOR, "a")
-            profile_url = link_elem.get_attribute('href')
-            if profile_url and '/in/' in profile_url:
-                # Clean the URL by removing miniProfileUrn parameter
-                clean_url = profile_url.split('?')[0] if '?' in profile_url else profile_url
-                return clean_url
-                
-        except:
-            pass
+                return profile_url.split('?')[0]
         
         return ""
     
-    def extract_detailed_profile(self, profile_url: str) -> Dict[str, str]:
-        """Extract detailed information from a profile page"""
+    def extract_detailed_profile(self, profile_url: str, navigate: bool = True) -> Dict[str, str]:
+        """Extract detailed information from a profile page in the current tab"""
         detailed_info = {
             'about': '',
             'experience': '',
@@ -416,70 +656,46 @@ class LinkedInScraper:
         try:
             print(f"      🔍 Opening profile: {profile_url}")
             
-            # Navigate to profile page
-            self.driver.get(profile_url)
-            time.sleep(5)  # Increased wait time for page to load
+            # Navigate to profile page unless it was preloaded in this tab
+            if navigate:
+                self._load_page(profile_url)
             
             # Wait for profile content to load
             try:
-                WebDriverWait(self.driver, 10).until(
+                WebDriverWait(self.driver, self.timeout).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, "h1.text-heading-xlarge"))
                 )
                 print(f"      ✅ Profile page loaded successfully")
             except TimeoutException:
                 print(f"      ⚠️  Profile page load timeout, continuing anyway...")
             
+            # Parse the rendered page once; every section below reads from this local tree
+            # instead of making a WebDriver round trip per selector
+            page_source = self.driver.page_source
+            soup = self._parse_page(page_source)
+            
             # Extract about section with multiple strategies
             try:
-                about_selectors = [
-                    # Modern LinkedIn selectors
-                    "section[aria-label='About'] div.display-flex.ph5.pv3",
-                    "section[aria-label='About'] div.pv-shared-text-with-see-more",
-                    "section[aria-label='About'] span.break-words",
-                    "section[aria-label='About'] div.text-body-medium",
-                    # Alternative selectors
-                    "section[aria-label='About'] div.pv-shared-text",
-                    "section[aria-label='About'] div.text-body-medium.break-words",
-                    "section[aria-label='About'] div.break-words",
-                    # Generic text selectors
-                    "section[aria-label='About'] div",
-                    "section[aria-label='About'] p",
-                    "section[aria-label='About'] span"
-                ]
-                
                 about_found = False
-                for selector in about_selectors:
-                    try:
-                        about_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        about_text = about_elem.text.strip()
-                        if about_text and len(about_text) > 10 and not about_text.startswith('About'):
-                            detailed_info['about'] = about_text
-                            about_found = True
-                            break
-                    except:
-                        continue
+                for selector in ABOUT_SELECTORS:
+                    about_text = self._element_text(soup.select_one(selector))
+                    if about_text and len(about_text) > 10 and not about_text.startswith('About'):
+                        detailed_info['about'] = about_text
+                        about_found = True
+                        break
                 
                 # Fallback: Look for any text that might be "about" content
                 if not about_found:
-                    try:
-                        page_text = self.driver.page_source
-                        if "About" in page_text:
-                            # Try to find text near "About" keyword
-                            about_sections = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'About')]")
-                            for section in about_sections:
-                                try:
-                                    parent = section.find_element(By.XPATH, "./..")
-                                    text = parent.text.strip()
-                                    if len(text) > 20 and "About" in text:
-                                        about_text = text.replace("About", "").strip()
-                                        if about_text:
-                                            detailed_info['about'] = about_text
-                                            about_found = True
-                                            break
-                                except:
-                                    continue
-                    except:
-                        pass
+                    # Try to find text near "About" keyword, reading the parent of the element holding it
+                    for about_string in soup.find_all(string=lambda text: text and 'About' in text):
+                        parent = about_string.parent.parent if about_string.parent else None
+                        text = self._element_text(parent)
+                        if len(text) > 20 and "About" in text:
+                            about_text = text.replace("About", "").strip()
+                            if about_text:
+                                detailed_info['about'] = about_text
+                                about_found = True
+                                break
                 
                 if not about_found:
                     detailed_info['about'] = "Not available"
@@ -489,77 +705,31 @@ class LinkedInScraper:
             
             # Extract experience section with multiple strategies
             try:
-                exp_selectors = [
-                    "section[aria-label='Experience']",
-                    "section[data-section='experience']",
-                    "section.experience-section"
-                ]
-                
                 exp_found = False
-                for selector in exp_selectors:
-                    try:
-                        exp_section = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        exp_items = exp_section.find_elements(By.CSS_SELECTOR, "li.artdeco-list__item")[:3]
-                        
-                        if not exp_items:
-                            # Try alternative selectors for experience items
-                            exp_items = exp_section.find_elements(By.CSS_SELECTOR, "li")[:3]
-                        
-                        experience_list = []
-                        for item in exp_items:
-                            try:
-                                # Multiple selectors for job title
-                                title_selectors = [
-                                    "span[aria-hidden='true']",
-                                    "h3",
-                                    ".t-bold",
-                                    ".experience__title",
-                                    "span.t-16.t-black.t-bold"
-                                ]
-                                
-                                title = ""
-                                for title_sel in title_selectors:
-                                    try:
-                                        title_elem = item.find_element(By.CSS_SELECTOR, title_sel)
-                                        title = title_elem.text.strip()
-                                        if title:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Multiple selectors for company
-                                company_selectors = [
-                                    "span.t-14.t-normal",
-                                    ".experience__company",
-                                    ".t-14.t-black--light",
-                                    "span.t-14"
-                                ]
-                                
-                                company = ""
-                                for company_sel in company_selectors:
-                                    try:
-                                        company_elem = item.find_element(By.CSS_SELECTOR, company_sel)
-                                        company = company_elem.text.strip()
-                                        if company and company != title:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if title and company:
-                                    experience_list.append(f"{title} at {company}")
-                                elif title:
-                                    experience_list.append(title)
-                                    
-                            except Exception as e:
-                                continue
-                        
-                        if experience_list:
-                            detailed_info['experience'] = "; ".join(experience_list)
-                            exp_found = True
-                            break
-                            
-                    except:
+                for selector in EXPERIENCE_SECTION_SELECTORS:
+                    exp_section = soup.select_one(selector)
+                    if not exp_section:
                         continue
+                    
+                    exp_items = exp_section.select("li.artdeco-list__item", limit=3)
+                    if not exp_items:
+                        # Try alternative selectors for experience items
+                        exp_items = exp_section.select("li", limit=3)
+                    
+                    experience_list = []
+                    for item in exp_items:
+                        title = self._first_text(item, EXPERIENCE_TITLE_SELECTORS)
+                        company = self._first_text(item, EXPERIENCE_COMPANY_SELECTORS, exclude=title)
+                        
+                        if title and company:
+                            experience_list.append(f"{title} at {company}")
+                        elif title:
+                            experience_list.append(title)
+                    
+                    if experience_list:
+                        detailed_info['experience'] = "; ".join(experience_list)
+                        exp_found = True
+                        break
                 
                 if not exp_found:
                     detailed_info['experience'] = "Not available"
@@ -569,77 +739,31 @@ class LinkedInScraper:
             
             # Extract education section with multiple strategies
             try:
-                edu_selectors = [
-                    "section[aria-label='Education']",
-                    "section[data-section='education']",
-                    "section.education-section"
-                ]
-                
                 edu_found = False
-                for selector in edu_selectors:
-                    try:
-                        edu_section = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        edu_items = edu_section.find_elements(By.CSS_SELECTOR, "li.artdeco-list__item")[:2]
-                        
-                        if not edu_items:
-                            # Try alternative selectors for education items
-                            edu_items = edu_section.find_elements(By.CSS_SELECTOR, "li")[:2]
-                        
-                        education_list = []
-                        for item in edu_items:
-                            try:
-                                # Multiple selectors for school name
-                                school_selectors = [
-                                    "span[aria-hidden='true']",
-                                    "h3",
-                                    ".t-bold",
-                                    ".education__school",
-                                    "span.t-16.t-black.t-bold"
-                                ]
-                                
-                                school = ""
-                                for school_sel in school_selectors:
-                                    try:
-                                        school_elem = item.find_element(By.CSS_SELECTOR, school_sel)
-                                        school = school_elem.text.strip()
-                                        if school:
-                                            break
-                                    except:
-                                        continue
-                                
-                                # Multiple selectors for degree
-                                degree_selectors = [
-                                    "span.t-14.t-normal",
-                                    ".education__degree",
-                                    ".t-14.t-black--light",
-                                    "span.t-14"
-                                ]
-                                
-                                degree = ""
-                                for degree_sel in degree_selectors:
-                                    try:
-                                        degree_elem = item.find_element(By.CSS_SELECTOR, degree_sel)
-                                        degree = degree_elem.text.strip()
-                                        if degree and degree != school:
-                                            break
-                                    except:
-                                        continue
-                                
-                                if school and degree:
-                                    education_list.append(f"{degree} from {school}")
-                                elif school:
-                                    education_list.append(school)
-                                    
-                            except Exception as e:
-                                continue
-                        
-                        if education_list:
-                            detailed_info['education'] = "; ".join(education_list)
-                            edu_found = True
-                            break
-                            
-                    except:
+                for selector in EDUCATION_SECTION_SELECTORS:
+                    edu_section = soup.select_one(selector)
+                    if not edu_section:
                         continue
+                    
+                    edu_items = edu_section.select("li.artdeco-list__item", limit=2)
+                    if not edu_items:
+                        # Try alternative selectors for education items
+                        edu_items = edu_section.select("li", limit=2)
+                    
+                    education_list = []
+                    for item in edu_items:
+                        school = self._first_text(item, EDUCATION_SCHOOL_SELECTORS)
+                        degree = self._first_text(item, EDUCATION_DEGREE_SELECTORS, exclude=school)
+                        
+                        if school and degree:
+                            education_list.append(f"{degree} from {school}")
+                        elif school:
+                            education_list.append(school)
+                    
+                    if education_list:
+                        detailed_info['education'] = "; ".join(education_list)
+                        edu_found = True
+                        break
                 
                 if not edu_found:
                     detailed_info['education'] = "Not available"
@@ -649,50 +773,44 @@ class LinkedInScraper:
             
             # Extract skills section with multiple strategies
             try:
-                skills_selectors = [
-                    "a[href*='/details/skills/']",
-                    "a[href*='skills']",
-                    "a[data-control-name='skill_details']",
-                    "a[aria-label*='skill']"
-                ]
-                
                 skills_found = False
-                for selector in skills_selectors:
+                for selector in SKILLS_LINK_SELECTORS:
                     try:
                         skills_link = self.driver.find_element(By.CSS_SELECTOR, selector)
+                        profile_page_url = self.driver.current_url
                         skills_link.click()
-                        time.sleep(3)  # Wait for skills page to load
                         
-                        # Multiple selectors for skill elements
-                        skill_selectors = [
-                            "span[aria-hidden='true']",
-                            ".skill-category-entity__name-text",
-                            ".skill-category-entity__name",
-                            ".skill-category-entity__skill-name",
-                            "span.t-bold",
-                            ".t-16.t-black.t-bold"
-                        ]
+                        # Wait for the skills page to render instead of sleeping a fixed time
+                        try:
+                            WebDriverWait(self.driver, self.timeout).until(EC.url_changes(profile_page_url))
+                            WebDriverWait(self.driver, self.timeout).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, "span[aria-hidden='true']"))
+                            )
+                        except TimeoutException:
+                            print(f"      ⚠️  Skills page load timeout, continuing anyway...")
                         
+                        # Parse the skills page once as well
+                        skills_soup = self._parse_page(self.driver.page_source)
                         skills = []
-                        for skill_sel in skill_selectors:
-                            try:
-                                skill_elements = self.driver.find_elements(By.CSS_SELECTOR, skill_sel)
-                                for elem in skill_elements:
-                                    skill_text = elem.text.strip()
-                                    if skill_text and len(skill_text) > 1 and skill_text not in skills:
-                                        skills.append(skill_text)
-                                if skills:
-                                    break
-                            except:
-                                continue
+                        for skill_sel in SKILL_ITEM_SELECTORS:
+                            # Ordered de-duplication without rescanning the list per skill
+                            skill_texts = (self._element_text(elem) for elem in skills_soup.select(skill_sel))
+                            skills = list(dict.fromkeys(text for text in skill_texts if len(text) > 1))
+                            if skills:
+                                break
                         
                         if skills:
                             detailed_info['skills'] = ", ".join(skills[:15])  # Limit to first 15 skills
                             skills_found = True
                         
-                        # Go back to main profile
+                        # Go back to main profile and wait for it to render again
                         self.driver.back()
-                        time.sleep(2)  # Wait for profile to reload
+                        try:
+                            WebDriverWait(self.driver, self.timeout).until(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, "h1.text-heading-xlarge"))
+                            )
+                        except TimeoutException:
+                            print(f"      ⚠️  Profile reload timeout, continuing anyway...")
                         break
                         
                     except:
@@ -701,16 +819,11 @@ class LinkedInScraper:
                 # Fallback: Try to extract skills from the main profile page
                 if not skills_found:
                     try:
-                        # Look for skills mentioned in the profile text
-                        page_text = self.driver.page_source.lower()
-                        common_skills = [
-                            'python', 'java', 'javascript', 'sql', 'html', 'css', 'react', 'angular', 'vue',
-                            'node.js', 'django', 'flask', 'spring', 'oracle', 'mysql', 'postgresql', 'mongodb',
-                            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'git', 'agile', 'scrum'
-                        ]
+                        # Look for skills mentioned in the profile page fetched above
+                        page_text = page_source.lower()
                         
                         found_skills = []
-                        for skill in common_skills:
+                        for skill in COMMON_SKILLS:
                             if skill in page_text:
                                 found_skills.append(skill.title())
                         
@@ -727,32 +840,16 @@ class LinkedInScraper:
                 detailed_info['skills'] = "Not available"
             
             # Extract connections
-            try:
-                connections_elem = self.driver.find_element(By.CSS_SELECTOR, "span.t-bold span")
-                detailed_info['connections'] = connections_elem.text.strip()
-            except:
-                detailed_info['connections'] = "Not available"
+            connections_elem = soup.select_one("span.t-bold span")
+            detailed_info['connections'] = self._element_text(connections_elem) if connections_elem else "Not available"
             
             # Extract headline from profile page
             try:
-                headline_selectors = [
-                    "div.text-body-medium.break-words",
-                    "div.text-body-medium",
-                    "div.break-words",
-                    "span.text-body-medium",
-                    "div[data-section='headline']",
-                    "h2.text-body-medium"
-                ]
-                
-                for selector in headline_selectors:
-                    try:
-                        headline_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        headline_text = headline_elem.text.strip()
-                        if headline_text and len(headline_text) > 5:
-                            detailed_info['headline'] = headline_text
-                            break
-                    except:
-                        continue
+                for selector in HEADLINE_SELECTORS:
+                    headline_text = self._element_text(soup.select_one(selector))
+                    if headline_text and len(headline_text) > 5:
+                        detailed_info['headline'] = headline_text
+                        break
                         
             except:
                 detailed_info['headline'] = "Not available"
@@ -781,24 +878,70 @@ class LinkedInScraper:
             print(f"         Connections: {detailed_info['connections']}")
             
             print(f"      ✅ Profile details extracted successfully")
-            
-            # Go back to search results
-            self.driver.back()
-            time.sleep(2)  # Wait for search results to reload
+            # Sub-extractors swallow their own errors, so only cache pages that actually showed a profile
+            profile_name = self._element_text(soup.select_one(PROFILE_NAME_CSS))
+            if profile_name or detailed_info.get('headline', "Not available") != "Not available":
+                self._cache_details(profile_url, detailed_info)
             
         except Exception as e:
             print(f"      ⚠️  Warning: Could not extract full profile details: {e}")
             detailed_info['profile_summary'] = "Profile details extraction failed"
-            
-            # Try to go back to search results even if extraction failed
-            try:
-                self.driver.back()
-                time.sleep(2)
-            except:
-                pass
         
         return detailed_info
     
+    def _get_cache(self) -> sqlite3.Connection:
+        """Open the on-disk profile details cache, creating it on first use"""
+        if self._cache_conn is None:
+            self._cache_conn = sqlite3.connect(self.cache_path)
+            self._cache_conn.execute(
+                "CREATE TABLE IF NOT EXISTS profile_details (url TEXT PRIMARY KEY, scraped_at REAL, data TEXT)"
+            )
+        return self._cache_conn
+    
+    def _get_cached_details(self, profile_url: str) -> Optional[Dict[str, str]]:
+        """Return cached profile details if they were extracted within PROFILE_CACHE_TTL"""
+        try:
+            row = self._get_cache().execute(
+                "SELECT scraped_at, data FROM profile_details WHERE url = ?", (profile_url.split('?')[0],)
+            ).fetchone()
+        except sqlite3.Error as e:
+            print(f"⚠️  Warning: Error reading profile cache: {e}")
+            return None
+        
+        if not row or time.time() - row[0] > PROFILE_CACHE_TTL:
+            return None
+        return orjson.loads(row[1])
+    
+    def _cache_details(self, profile_url: str, detailed_info: Dict[str, str]):
+        """Store extracted profile details in the on-disk cache"""
+        try:
+            with self._get_cache() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO profile_details (url, scraped_at, data) VALUES (?, ?, ?)",
+                    (profile_url.split('?')[0], time.time(), orjson.dumps(detailed_info))
+                )
+        except sqlite3.Error as e:
+            print(f"⚠️  Warning: Error writing profile cache: {e}")
+    
+    def _parse_page(self, page_source: str) -> BeautifulSoup:
+        """Parse page HTML, dropping markup whose text is never shown"""
+        soup = BeautifulSoup(page_source, 'lxml')
+        for element in soup.select(NON_VISIBLE_TEXT_CSS):
+            element.decompose()
+        return soup
+    
+    def _element_text(self, element) -> str:
+        """Return an element's text with whitespace collapsed, or '' when there is no element"""
+        return " ".join(element.get_text(" ").split()) if element else ""
+    
+    def _first_text(self, root, selectors: List[str], exclude: str = "") -> str:
+        """Return the first non-empty text, other than exclude, found by a list of fallback selectors"""
+        for selector in selectors:
+            text = self._element_text(root.select_one(selector))
+            if text and text != exclude:
+                return text
+        return ""
+    
     def save_results(self, profiles: List[ProfileData], skills: List[str], location: str, experience: str):
         """Save scraped profiles to files"""
         if not profiles:
@@ -816,8 +959,8 @@ class LinkedInScraper:
         
         # Save to JSON
         json_filename = f"{filename_base}.json"
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump([profile.to_dict() for profile in profiles], f, indent=2, ensure_ascii=False)
+        with open(json_filename, 'wb') as f:
+            f.write(orjson.dumps([profile.to_dict() for profile in profiles], option=orjson.OPT_INDENT_2))
         print(f"💾 Saved {len(profiles)} profiles to: {json_filename}")
         
         # Save to CSV
@@ -827,7 +970,8 @@ class LinkedInScraper:
             with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                writer.writerows([profile.to_dict() for profile in profiles])
+                # Stream rows to disk instead of materializing every dict first
+                writer.writerows(profile.to_dict() for profile in profiles)
             print(f"💾 Saved {len(profiles)} profiles to: {csv_filename}")
         
         return json_filename, csv_filename
@@ -840,6 +984,10 @@ class LinkedInScraper:
                 print("🔒 Browser closed")
             except Exception as e:
                 print(f"⚠️  Warning: Error closing browser: {e}")
+        
+        if self._cache_conn is not None:
+            self._cache_conn.close()
+            self._cache_conn = None
 
 def get_user_inputs():
     """Get user inputs for the scraper"""
@@ -857,7 +1005,7 @@ def get_user_inputs():
         print("❌ Skills are required!")
         return None, None, None
     
-    skills = [skill.strip() for skill in skills_input.split(',') if skill.strip()]
+    skills = list(dict.fromkeys(skill.strip() for skill in skills_input.split(',') if skill.strip()))
     
     # Get location
     print("\n2️⃣  LOCATION")
@@ -868,25 +1016,12 @@ def get_user_inputs():
     # Get experience level
     print("\n3️⃣  EXPERIENCE LEVEL")
     print("Choose experience level (optional - press Enter to skip):")
-    print("1. Internship")
-    print("2. Entry Level")
-    print("3. Associate")
-    print("4. Mid-Senior")
-    print("5. Director")
-    print("6. Executive")
+    for choice, level in EXPERIENCE_LEVELS.items():
+        print(f"{choice}. {level}")
     
     experience_choice = input("\nEnter choice (1-6) or press Enter to skip: ").strip()
     
-    experience_mapping = {
-        "1": "Internship",
-        "2": "Entry Level", 
-        "3": "Associate",
-        "4": "Mid-Senior",
-        "5": "Director",
-        "6": "Executive"
-    }
-    
-    experience = experience_mapping.get(experience_choice, "") if experience_choice else ""
+    experience = EXPERIENCE_LEVELS.get(experience_choice, "")
     
     # Get number of profiles to scrape
     print("\n4️⃣  NUMBER OF PROFILES")
@@ -902,6 +1037,71 @@ def get_user_inputs():
     
     return skills, location, experience, limit
 
+# Browser session owned by a scrape_many worker process, reused for every search it runs
+_worker_scraper = None
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this pid is still running"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _claim_profile_slot(slot_owners) -> int:
+    """Claim a Chrome profile slot no live worker holds; a crashed worker's slot is taken over by its replacement"""
+    with slot_owners.get_lock():
+        for slot, owner in enumerate(slot_owners):
+            if not owner or not _process_alive(owner):
+                slot_owners[slot] = os.getpid()
+                return slot
+    raise RuntimeError("no free Chrome profile slot")
+
+def _init_search_worker(headless: bool, slot_owners):
+    """Start and log in this worker process's own browser"""
+    global _worker_scraper
+    scraper = LinkedInScraper(headless=headless)
+    try:
+        # Chrome locks a user-data-dir to one browser, so each worker gets its own; numbering them
+        # by slot rather than pid lets later runs reuse the directories and their saved logins
+        scraper.chrome_profile_dir = f"{CHROME_PROFILE_DIR}-{_claim_profile_slot(slot_owners)}"
+        # Safari allows one session and ignores headless and the profile directory, so workers use Chrome
+        scraper.setup_driver(use_safari=False)
+        scraper.logged_in = scraper.login_to_linkedin()
+    except Exception as e:
+        # An initializer that raises makes the pool respawn workers forever; skip this worker's searches instead
+        print(f"❌ Worker {os.getpid()} could not start its browser: {e}")
+        scraper.close()
+        return
+    _worker_scraper = scraper
+    # Quit the browser when the pool shuts the worker down
+    Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+def _run_search(search: tuple) -> List[ProfileData]:
+    """Run one (skills, location, experience, limit) search in a worker process"""
+    if _worker_scraper is None or not _worker_scraper.logged_in:
+        print(f"❌ Worker {os.getpid()} is not logged in, skipping search")
+        return []
+    return _worker_scraper.search_profiles(*search)
+
+def scrape_many(searches: List[tuple], workers: int = 4, headless: bool = True) -> List[List[ProfileData]]:
+    """Run several profile searches in parallel, one browser per worker process"""
+    if not searches:
+        return []
+    
+    workers = min(workers, len(searches))
+    # Pid of the worker holding each Chrome profile slot; 0 while the slot is free
+    slot_owners = multiprocessing.Array('i', workers)
+    pool = multiprocessing.Pool(workers, initializer=_init_search_worker, initargs=(headless, slot_owners))
+    try:
+        return pool.map(_run_search, searches)
+    finally:
+        # close/join rather than terminate so each worker's browser is quit on the way out
+        pool.close()
+        pool.join()
+
 def main():
     """Main function"""
     try:
@@ -925,52 +1125,48 @@ def main():
             print("❌ Scraping cancelled")
             return
         
-        # Initialize scraper
+        # Initialize scraper; the session is torn down when the block exits
         print("\n🚀 Initializing LinkedIn Scraper...")
-        scraper = LinkedInScraper(headless=False)
-        
-        # Setup driver
         print("🌐 Setting up browser...")
-        driver = scraper.setup_driver()
-        
-        # Login to LinkedIn
-        if not scraper.login_to_linkedin():
-            print("❌ Failed to login. Exiting...")
-            return
-        
-        # Search for profiles
-        print(f"\n🔍 Searching for profiles...")
-        profiles = scraper.search_profiles(skills, location, experience, limit)
-        
-        if not profiles:
-            print("❌ No profiles found")
-            return
-        
-        # Save results
-        print(f"\n💾 Saving {len(profiles)} profiles...")
-        json_file, csv_file = scraper.save_results(profiles, skills, location, experience)
-        
-        # Print summary
-        print(f"\n🎉 Scraping completed successfully!")
-        print(f"📊 Total profiles scraped: {len(profiles)}")
-        print(f"📁 Files saved:")
-        print(f"   - JSON: {json_file}")
-        print(f"   - CSV: {csv_file}")
-        
-        # Show sample profiles
-        print(f"\n📋 Sample profiles:")
-        for i, profile in enumerate(profiles[:3]):
-            print(f"   {i+1}. {profile.name} - {profile.headline}")
-            if profile.location and profile.location != "N/A":
-                print(f"      📍 {profile.location}")
-            if profile.current_company and profile.current_company != "N/A":
-                print(f"      🏢 {profile.current_company}")
-            if profile.profile_summary and profile.profile_summary != "Profile details extraction failed":
-                print(f"      📝 Summary: {profile.profile_summary[:150]}...")
-            if profile.detailed_skills and profile.detailed_skills != "Not available":
-                print(f"      🎯 Skills: {profile.detailed_skills[:100]}...")
-            print(f"      🔗 {profile.profile_url}")
-            print()
+        with LinkedInScraper(headless=False) as scraper:
+            # Login to LinkedIn
+            if not scraper.logged_in:
+                print("❌ Failed to login. Exiting...")
+                return
+            
+            # Search for profiles
+            print(f"\n🔍 Searching for profiles...")
+            profiles = scraper.search_profiles(skills, location, experience, limit)
+            
+            if not profiles:
+                print("❌ No profiles found")
+                return
+            
+            # Save results
+            print(f"\n💾 Saving {len(profiles)} profiles...")
+            json_file, csv_file = scraper.save_results(profiles, skills, location, experience)
+            
+            # Print summary
+            print(f"\n🎉 Scraping completed successfully!")
+            print(f"📊 Total profiles scraped: {len(profiles)}")
+            print(f"📁 Files saved:")
+            print(f"   - JSON: {json_file}")
+            print(f"   - CSV: {csv_file}")
+            
+            # Show sample profiles
+            print(f"\n📋 Sample profiles:")
+            for i, profile in enumerate(profiles[:3]):
+                print(f"   {i+1}. {profile.name} - {profile.headline}")
+                if profile.location and profile.location != "N/A":
+                    print(f"      📍 {profile.location}")
+                if profile.current_company and profile.current_company != "N/A":
+                    print(f"      🏢 {profile.current_company}")
+                if profile.profile_summary and profile.profile_summary != "Profile details extraction failed":
+                    print(f"      📝 Summary: {profile.profile_summary[:150]}...")
+                if profile.detailed_skills and profile.detailed_skills != "Not available":
+                    print(f"      🎯 Skills: {profile.detailed_skills[:100]}...")
+                print(f"      🔗 {profile.profile_url}")
+                print()
         
     except KeyboardInterrupt:
         print("\n\n❌ Scraping interrupted by user")
@@ -978,9 +1174,6 @@ def main():
         print(f"\n❌ An error occurred: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        if 'scraper' in locals():
-            scraper.close()
 
 if __name__ == "__main__":
     main()
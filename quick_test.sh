@@ -14,7 +14,7 @@ echo
 
 # Install essential dependencies only
 echo "📦 Installing essential dependencies..."
-pip3 install selenium beautifulsoup4 pandas openpyxl python-dotenv
+pip3 install selenium beautifulsoup4 lxml requests orjson pandas openpyxl xlsxwriter python-dotenv
 
 # Check if Chrome is installed
 if command -v google-chrome &> /dev/null; then
@@ -0,0 +1,103 @@
+"""
+Settings and helpers shared by linkedin_scraper.py and linkedin_scraper_final.py
+Kept free of side effects and heavy imports so either script can load it at startup
+"""
+
+import re
+import sys
+from functools import lru_cache
+
+# Slotted dataclasses drop the per-instance __dict__; slots= needs Python 3.10+
+DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Scraped profiles persisted across runs, keyed on the normalized profile URL
+PROFILE_CACHE_PATH = ".linkedin_cache.sqlite"
+PROFILE_CACHE_TTL = 7 * 24 * 3600
+
+# Chrome profile kept between runs so the li_at session cookie survives
+CHROME_PROFILE_DIR = ".chrome-linkedin"
+FEED_URL = "https://www.linkedin.com/feed/"
+# URL fragments LinkedIn redirects to once a login attempt has been processed
+LOGIN_REDIRECT_MARKERS = ("feed", "mynetwork", "checkpoint")
+
+# Present once a profile page has rendered
+PROFILE_NAME_CSS = "h1.text-heading-xlarge"
+
+# Page resources the scrapers never read; blocked to cut page weight
+CHROME_CONTENT_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.default_content_setting_values.notifications': 2
+}
+BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.gif', '*.webp', '*.svg',
+    '*.woff', '*.woff2', '*.ttf', '*.mp4', '*.webm',
+    '*media.licdn.com/*', '*google-analytics*', '*doubleclick*',
+    '*/li/track*', '*/tracking/*', '*px.ads.linkedin.com*'
+]
+
+
+def block_page_resources(driver):
+    """Apply the blocked URL list to the driver's current tab; Chrome scopes it to one tab"""
+    if hasattr(driver, 'execute_cdp_cmd'):
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+
+
+def _skill_pattern(skill: str) -> re.Pattern:
+    """Compile a pattern matching a skill only as a whole word, so 'java' misses 'javascript'"""
+    return re.compile(r'(?<!\w)' + re.escape(skill) + r'(?!\w)')
+
+
+@lru_cache(maxsize=32)
+def _normalize_target_skills(target_skills: tuple) -> tuple:
+    """Lowercase target skills once, join them for substring scans and compile their patterns"""
+    target_skills_lower = [skill.lower().strip() for skill in target_skills]
+    target_patterns = [_skill_pattern(skill) for skill in target_skills_lower]
+    return target_skills_lower, "\n".join(target_skills_lower), target_patterns
+
+
+@lru_cache(maxsize=4096)
+def skill_match(profile_skills: tuple, target_skills: tuple) -> tuple:
+    """Score profile skills against target skills; returns (score, matched targets)"""
+    # Normalize skills for comparison; the target side is cached across calls
+    profile_skills_lower = [skill.lower().strip() for skill in profile_skills]
+    target_skills_lower, target_text, target_patterns = _normalize_target_skills(target_skills)
+    
+    # Join the profile side into one newline-separated string so every containment
+    # test is a single C-level scan instead of a Python loop over skill pairs
+    profile_text = "\n".join(profile_skills_lower)
+    
+    # Exact hits come from one set intersection and skip the pattern search
+    matched = set(target_skills_lower).intersection(profile_skills_lower)
+    
+    # Every target is already an exact hit; nothing is left to search for
+    if target_skills_lower and len(matched) == len(target_skills_lower):
+        return 100.0, tuple(target_skills_lower)
+    
+    # Other targets appearing as a whole word in a profile skill; a plain find rejects most
+    # targets and starts the slower boundary-checked search at the first occurrence
+    for target_skill, pattern in zip(target_skills_lower, target_patterns):
+        if target_skill in matched:
+            continue
+        position = profile_text.find(target_skill)
+        if position >= 0 and pattern.search(profile_text, position):
+            matched.add(target_skill)
+    
+    # Profile skills appearing as a whole word in a target; most are rejected by the joined scan.
+    # Skipped once every target has matched
+    for profile_skill in profile_skills_lower:
+        if len(matched) == len(target_skills_lower):
+            break
+        if profile_skill and profile_skill in target_text:
+            pattern = _skill_pattern(profile_skill)
+            matched.update(
+                target_skill for target_skill in target_skills_lower
+                if profile_skill in target_skill and pattern.search(target_skill)
+            )
+    
+    matched_skills = [target_skill for target_skill in target_skills_lower if target_skill in matched]
+    
+    # Calculate match percentage
+    match_score = (len(matched_skills) / len(target_skills)) * 100 if target_skills else 0
+    
+    return match_score, tuple(matched_skills)
@@ -0,0 +1,21 @@
+import linkedin_scraper
+from linkedin_scraper import JobListing, JobSearchRequest, LinkedInScraper
+
+
+def test_job_search_keeps_the_best_matches_in_linkedin_order_for_ties(tmp_path, monkeypatch):
+    scores = {"a": 10, "b": 50, "c": 10, "d": 50, "e": 90, "f": None}
+
+    def extract_job(self, container, skills):
+        if scores[container] is None:
+            return None
+        return JobListing(title=container, company="Acme", location="Remote", match_score=scores[container])
+
+    monkeypatch.setattr(LinkedInScraper, '_extract_job_from_element', extract_job)
+    monkeypatch.setattr(linkedin_scraper, '_search_cache', {})
+    scraper = LinkedInScraper()
+    scraper.cache_path = str(tmp_path / "cache.sqlite")
+    request = JobSearchRequest(skills=["Python"], limit=3)
+
+    response = scraper._build_job_search_response(request, list(scores), scraper._search_cache_key(request))
+
+    assert [job.title for job in response.jobs] == ["e", "b", "d"]
@@ -0,0 +1,55 @@
+import atexit
+
+from selenium.common.exceptions import WebDriverException
+
+import linkedin_scraper
+from linkedin_scraper import JobSearchRequest, LinkedInScraper
+
+
+class FakeDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+        self.page_source = "<html></html>"
+
+    @property
+    def current_url(self):
+        if not self.alive:
+            raise WebDriverException("browser window was closed")
+        return "https://www.linkedin.com/jobs/search"
+
+    def get(self, url):
+        pass
+
+    def find_element(self, *args):
+        return object()
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_search_jobs_replaces_a_dead_browser_and_registers_close_once(tmp_path, monkeypatch):
+    started, registered = [], []
+
+    def setup_driver(self, use_safari=True):
+        self.driver = FakeDriver()
+        started.append(self.driver)
+        return self.driver
+
+    monkeypatch.setattr(LinkedInScraper, 'setup_driver', setup_driver)
+    monkeypatch.setattr(LinkedInScraper, '_fetch_job_cards', lambda self, request: [])
+    monkeypatch.setattr(atexit, 'register', registered.append)
+    monkeypatch.setattr(linkedin_scraper, '_search_cache', {})
+
+    scraper = LinkedInScraper()
+    scraper.cache_path = str(tmp_path / "cache.sqlite")
+
+    scraper.search_jobs(JobSearchRequest(skills=["Python"]))
+    started[0].alive = False
+    scraper.search_jobs(JobSearchRequest(skills=["Oracle"]))
+    scraper.close()
+    scraper.search_jobs(JobSearchRequest(skills=["SQL"]))
+
+    assert len(started) == 3
+    assert started[0].quit_called
+    assert registered == [scraper.close]
@@ -0,0 +1,47 @@
+import sqlite3
+
+from linkedin_scraper import LinkedInScraper, ProfileData
+
+
+class FakeDriver:
+    def __init__(self, quit_drivers):
+        self.quit_drivers = quit_drivers
+
+    def quit(self):
+        self.quit_drivers.append(self)
+
+
+def test_batch_caches_profiles_and_closes_every_worker(tmp_path, monkeypatch):
+    started, quit_drivers, fetched = [], [], []
+
+    def setup_driver(self, use_safari=True):
+        self.driver = FakeDriver(quit_drivers)
+        started.append(self.driver)
+        return self.driver
+
+    def fetch_profile_api(self, profile_url):
+        fetched.append(profile_url)
+        return ProfileData(name=profile_url.rsplit('/', 2)[-2], profile_url=profile_url, skills=["SQL"])
+
+    monkeypatch.setattr(LinkedInScraper, 'setup_driver', setup_driver)
+    monkeypatch.setattr(LinkedInScraper, 'login_to_linkedin', lambda self: True)
+    monkeypatch.setattr(LinkedInScraper, '_fetch_profile_api', fetch_profile_api)
+
+    scraper = LinkedInScraper()
+    scraper.cache_path = str(tmp_path / "cache.sqlite")
+    scraper.delay_between_requests = 0
+    urls = [f"https://www.linkedin.com/in/person-{index}/" for index in range(6)]
+
+    profiles = scraper.scrape_profiles_batch(urls, workers=3)
+
+    assert [profile.name for profile in profiles] == [f"person-{index}" for index in range(6)]
+    assert started and sorted(map(id, quit_drivers)) == sorted(map(id, started))
+    with sqlite3.connect(scraper.cache_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0] == 6
+
+    # A second batch is served entirely from the cache the first one wrote
+    fetched.clear()
+    profiles = scraper.scrape_profiles_batch(urls, workers=3)
+
+    assert fetched == []
+    assert [profile.name for profile in profiles] == [f"person-{index}" for index in range(6)]
@@ -0,0 +1,69 @@
+import multiprocessing
+import subprocess
+
+import pytest
+
+import linkedin_scraper_final
+from linkedin_scraper_final import LinkedInScraper, scrape_many
+
+# The fakes below reach the workers by being patched in before the pool forks
+requires_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork', reason="workers only inherit patches under fork"
+)
+
+
+class FakeDriver:
+    def quit(self):
+        pass
+
+
+def fake_setup_driver(self, use_safari=True):
+    self.used_safari = use_safari
+    self.driver = FakeDriver()
+    return self.driver
+
+
+@requires_fork
+def test_workers_start_chrome_on_their_own_profile_slots(monkeypatch):
+    monkeypatch.setattr(LinkedInScraper, 'setup_driver', fake_setup_driver)
+    monkeypatch.setattr(LinkedInScraper, 'login_to_linkedin', lambda self: True)
+    monkeypatch.setattr(
+        LinkedInScraper, 'search_profiles', lambda self, *search: [(self.chrome_profile_dir, self.used_safari)]
+    )
+
+    results = scrape_many([("a",), ("b",), ("c",), ("d",)], workers=2)
+
+    assert len(results) == 4
+    assert {used_safari for [(_, used_safari)] in results} == {False}
+    assert {profile_dir for [(profile_dir, _)] in results} <= {".chrome-linkedin-0", ".chrome-linkedin-1"}
+
+
+@requires_fork
+def test_workers_that_fail_to_start_skip_their_searches(monkeypatch):
+    def broken_setup_driver(self, use_safari=True):
+        raise RuntimeError("profile locked")
+
+    monkeypatch.setattr(LinkedInScraper, 'setup_driver', broken_setup_driver)
+
+    assert scrape_many([("a",), ("b",), ("c",)], workers=2) == [[], [], []]
+
+
+def test_empty_search_list_starts_no_pool(monkeypatch):
+    monkeypatch.setattr(multiprocessing, 'Pool', None)
+
+    assert scrape_many([]) == []
+
+
+def test_profile_slots_skip_live_owners_and_reclaim_dead_ones():
+    finished = subprocess.Popen(["true"])
+    finished.wait()
+    live = subprocess.Popen(["sleep", "30"])
+    try:
+        slot_owners = multiprocessing.Array('i', [live.pid, finished.pid])
+
+        assert linkedin_scraper_final._claim_profile_slot(slot_owners) == 1
+        with pytest.raises(RuntimeError):
+            linkedin_scraper_final._claim_profile_slot(slot_owners)
+    finally:
+        live.kill()
+        live.wait()
@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+from linkedin_scraper import LinkedInScraper
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def load_profile_view():
+    return json.loads((FIXTURES / "voyager_profile_view.json").read_text())
+
+
+def test_parse_profile_view_reads_profile_positions_and_education():
+    scraper = LinkedInScraper()
+    profile = scraper._parse_profile_view(
+        load_profile_view(), ["Oracle", "PL/SQL"], "https://www.linkedin.com/in/priya-raman/"
+    )
+
+    assert profile.name == "Priya Raman"
+    assert profile.headline == "Senior Oracle PL/SQL Developer"
+    assert profile.location == "Pune, Maharashtra"
+    assert profile.current_company == "Infosys"
+    assert profile.experience == (
+        "Senior PL/SQL Developer at Infosys; Oracle Developer at TCS; Database Analyst at Wipro"
+    )
+    assert profile.education == "B.E. Computer Engineering from University of Pune"
+    assert profile.about.startswith("Ten years of Oracle Database work")
+    assert profile.skills == ["Oracle", "PL/SQL"]
+    assert profile.total_skills_count == 2
+    assert {"oracle", "pl/sql", "performance tuning"} <= set(profile.required_skills_matched)
+
+
+def test_parse_profile_view_without_a_name_returns_none():
+    data = load_profile_view()
+    data["profile"]["firstName"] = data["profile"]["lastName"] = ""
+
+    assert LinkedInScraper()._parse_profile_view(data, [], "https://www.linkedin.com/in/x/") is None
+
+
+def test_api_session_requests_plain_json():
+    class FakeDriver:
+        def get_cookies(self):
+            return [{'name': 'li_at', 'value': 'token'}, {'name': 'JSESSIONID', 'value': '"ajax:1"'}]
+
+        def execute_script(self, script):
+            return "test-agent"
+
+    scraper = LinkedInScraper()
+    scraper.driver = FakeDriver()
+    session = scraper._get_api_session()
+
+    assert session.headers['accept'] == 'application/json'
+    assert session.headers['csrf-token'] == 'ajax:1'